@@ -2,13 +2,40 @@ import logging
 import os
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..types import Log, Response
 
+# Size of the keep-alive connection pool kept open to the engine
+_POOL_SIZE = 64
+
 
 class InternalEndureClient:
 
     _base_url = os.getenv("DURABLE_ENGINE_BASE_URL")
+    _session = None
+
+    @classmethod
+    def _get_session(self) -> requests.Session:
+        """
+        Returns the shared HTTP session used to talk to the engine, creating it
+        on first use. Reusing one session keeps connections to the engine alive
+        across calls instead of opening a new one per log.
+
+        Returns:
+            requests.Session: The shared session.
+        """
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=_POOL_SIZE,
+                pool_maxsize=_POOL_SIZE,
+                max_retries=0,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
 
     @classmethod
     def send_log(self, execution_id: str, log: Log, action_name: str):
@@ -27,37 +54,50 @@ class InternalEndureClient:
             ValueError: If DURABLE_ENGINE_BASE_URL is not set or if required parameters are missing.
             requests.exceptions.HTTPError: If the request fails.
         """  # noqa: E501
-        try:
-            logging.info(
-                f"Attempting to send log to engine - Execution ID: {execution_id}, Action: {action_name}"
+        logging.info(
+            f"Attempting to send log to engine - Execution ID: {execution_id}, Action: {action_name}"
+        )
+        logging.info(f"Base URL: {self._base_url}")
+
+        if not self._base_url:
+            logging.error(
+                "DURABLE_ENGINE_BASE_URL is not set in environment variables."
+            )
+            raise ValueError(
+                "DURABLE_ENGINE_BASE_URL is not set in environment variables."
             )
-            logging.info(f"Base URL: {self._base_url}")
 
-            if not self._base_url:
-                logging.error(
-                    "DURABLE_ENGINE_BASE_URL is not set in environment variables."
-                )
-                raise ValueError(
-                    "DURABLE_ENGINE_BASE_URL is not set in environment variables."
-                )
+        if not log or not action_name:
+            logging.error("log and action_name must be provided.")
+            raise ValueError("log and action_name must be provided.")
 
-            if not log or not action_name:
-                logging.error("log and action_name must be provided.")
-                raise ValueError("log and action_name must be provided.")
+        url = f"{self._base_url}/executions/{execution_id}/log/{action_name}"
+        return self._patch_log(url, log.to_dict())
 
-            url = (
-                f"{self._base_url}/executions/{execution_id}/log/{action_name}"
-            )
+    @classmethod
+    def _patch_log(self, url: str, payload: dict):
+        """
+        Sends a log payload to the given engine URL and wraps the reply.
+
+        Args:
+            url (str): The engine endpoint to send the payload to.
+            payload (dict): The JSON-serializable log payload.
+
+        Returns:
+            dict: A dictionary containing the response from the Durable Execution Engine.
+        """
+        try:
             headers = {"Content-Type": "application/json"}
-            payload = log.to_dict()
 
             logging.info(f"Making request to: {url}")
             logging.info(f"Request headers: {headers}")
             logging.info(f"Request payload: {payload}")
 
-            response = requests.patch(url, headers=headers, json=payload)
+            response = self._get_session().patch(
+                url, headers=headers, json=payload
+            )
             logging.info(
-                "Log sent to the Durable Execution Engine: {}".format(log)
+                "Log sent to the Durable Execution Engine: {}".format(payload)
             )
             logging.info(f"Response status code: {response.status_code}")
             # Safety check for headers attribute (for MockResponse in tests)
@@ -123,7 +163,7 @@ class InternalEndureClient:
             raise e
         except Exception as e:
             logging.error(
-                f"UNEXPECTED ERROR in send_log: {type(e).__name__}: {e}"
+                f"UNEXPECTED ERROR in _patch_log: {type(e).__name__}: {e}"
             )
             raise e
 
@@ -164,7 +204,7 @@ class InternalEndureClient:
             logging.info(f"Making request to: {url}")
             logging.info(f"Request headers: {headers}")
 
-            response = requests.patch(url, headers=headers)
+            response = self._get_session().patch(url, headers=headers)
             logging.info(
                 "Execution marked as running: {}".format(response)
             )
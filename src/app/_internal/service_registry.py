@@ -1,6 +1,9 @@
 from typing import Dict, List
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from starlette.routing import Route
 
 from .workflow import Workflow
 
@@ -15,6 +18,7 @@ class ServiceRegistry:
         _instance (ServiceRegistry): The singleton instance of the registry.
         _services (Dict[str, List[Workflow]]): Mapping of service names to lists of registered workflows.
         _router (APIRouter): FastAPI router containing dynamically registered workflow endpoints.
+        _version (int): Counter bumped whenever the registered services change.
 
     Methods:
         __new__(cls): Creates or returns the singleton instance.
@@ -28,6 +32,7 @@ class ServiceRegistry:
     _instance = None
     _services: Dict[str, List[Workflow]]
     _router: APIRouter
+    _version: int
 
     def __new__(cls):
         """
@@ -41,6 +46,7 @@ class ServiceRegistry:
             cls._instance = super(ServiceRegistry, cls).__new__(cls)
             cls._instance._services = {}
             cls._instance._router = APIRouter()
+            cls._instance._version = 0
         return cls._instance
 
     def register_workflow(self, service_name: str, workflow: Workflow):
@@ -72,6 +78,7 @@ class ServiceRegistry:
             )
 
         self._services[service_name].append(workflow)
+        self._version += 1
 
     def register_workflow_in_router(
         self, service_name: str, workflow: Workflow
@@ -81,14 +88,20 @@ class ServiceRegistry:
         The endpoint will be available at /execute/{service_name}/{workflow.name}
         and will accept POST requests.
 
+        The handler reads the raw request itself, so it is mounted as a plain
+        Starlette route. This skips FastAPI's per-route dependency and schema
+        analysis, and keeps workflow endpoints out of the OpenAPI schema.
+
         Args:
             service_name (str): The service name to use in the endpoint path.
             workflow (Workflow): The workflow whose handler will be registered.
         """
-        self._router.add_api_route(
-            f"/execute/{service_name}/{workflow.name}",
-            workflow.get_handler_route(),
-            methods=["POST"],
+        self._router.routes.append(
+            Route(
+                f"/execute/{service_name}/{workflow.name}",
+                _json_endpoint(workflow.get_handler_route()),
+                methods=["POST"],
+            )
         )
 
     def get_services(self) -> Dict[str, List[Workflow]]:
@@ -101,6 +114,16 @@ class ServiceRegistry:
         """
         return self._services.copy()
 
+    def get_version(self) -> int:
+        """
+        Returns a counter that changes every time a workflow is registered or
+        the registry is cleared, so callers can cache data derived from it.
+
+        Returns:
+            int: The current registry version.
+        """
+        return self._version
+
     def get_router(self) -> APIRouter:
         """
         Returns the FastAPI router containing all registered workflow endpoints.
@@ -121,6 +144,25 @@ class ServiceRegistry:
         This is primarily useful for testing purposes.
         """
         self._services.clear()
+        self._version += 1
         self._router = APIRouter()
         self.__class__._instance = None
         self.__class__()
+
+
+def _json_endpoint(handler):
+    """
+    Wraps a workflow handler so its result is returned as a JSON response,
+    encoded the same way FastAPI encodes API route return values.
+
+    Args:
+        handler (Callable): The async handler from Workflow.get_handler_route.
+
+    Returns:
+        Callable: An async Starlette endpoint.
+    """
+
+    async def endpoint(request: Request) -> JSONResponse:
+        return JSONResponse(jsonable_encoder(await handler(request)))
+
+    return endpoint
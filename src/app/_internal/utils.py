@@ -3,6 +3,9 @@ from typing import Any
 
 from pydantic import BaseModel
 
+# Types that are already JSON-compatible and need no traversal
+_JSON_SCALARS = frozenset({str, int, float, bool, type(None)})
+
 
 def validate_retention_period(retention: int) -> None:
     """
@@ -42,6 +45,8 @@ def serialize_data(data: Any) -> Any:
         >>> serialize_data([UserModel(name="John"), UserModel(name="Jane")])
         [{"name": "John"}, {"name": "Jane"}]
     """
+    if type(data) in _JSON_SCALARS:
+        return data
     if isinstance(data, BaseModel):
         # Handle both Pydantic v1 (.dict()) and v2 (.model_dump())
         if hasattr(data, "model_dump"):
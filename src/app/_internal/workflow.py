@@ -1,5 +1,7 @@
 import asyncio
+import sys
 from dataclasses import is_dataclass
+from functools import lru_cache
 from typing import Any, Callable, Union, get_args, get_origin, get_type_hints
 
 import requests
@@ -12,6 +14,175 @@ from ..types import EndureException
 from .internal_client import InternalEndureClient
 from .utils import serialize_data
 
+# Error messages for malformed requests; each raise builds its own output
+# dict around them so no two exceptions share a mutable output
+_BODY_NOT_OBJECT_ERROR = "Request body must be a JSON object"
+_MISSING_FIELDS_ERROR = (
+    "Request must include 'execution_id' and 'input' fields"
+)
+
+
+@lru_cache(maxsize=None)
+def _resolved_hints(func: Callable) -> tuple:
+    """
+    Resolves the type hints of a workflow function once per function object.
+
+    Args:
+        func (Callable): The workflow function to inspect.
+
+    Returns:
+        tuple: The (name, type) pairs returned by get_type_hints.
+    """
+    return tuple(get_type_hints(func).items())
+
+
+def _type_description(typ):
+    """
+    Returns the cached description of a type annotation, falling back to an
+    uncached lookup for annotations that cannot be hashed.
+
+    Args:
+        typ: The type to describe.
+
+    Returns:
+        Union[str, tuple]: A string for simple types, or (field, description)
+            pairs for user-defined classes.
+    """
+    try:
+        return _describe_type(typ)
+    except TypeError:
+        return _describe_type.__wrapped__(typ)
+
+
+@lru_cache(maxsize=None)
+def _describe_type(typ):
+    """
+    Describes a type annotation. See Workflow._get_type_description for the
+    supported annotations; class descriptions are returned as tuples so that
+    cached values cannot be mutated.
+
+    Only the top-level annotation is cached. Nested annotations are walked
+    iteratively, memoized by id() for the duration of the call, so deep types
+    neither hash every sub-annotation nor recurse.
+    """
+    described = {}
+    visiting = set()
+    stack = [(typ, None)]
+    while stack:
+        node, children = stack.pop()
+        key = id(node)
+        if key in described:
+            continue
+        if children is None:
+            children = _type_children(node)
+            if children:
+                if key in visiting:
+                    raise RecursionError(
+                        f"Type {node!r} refers to itself and cannot be described"
+                    )
+                visiting.add(key)
+                stack.append((node, children))
+                stack.extend((child, None) for child in children)
+                continue
+        visiting.discard(key)
+        described[key] = _format_type(
+            node, [described[id(child)] for child in children]
+        )
+    return described[id(typ)]
+
+
+def _type_children(typ) -> tuple:
+    """
+    Returns the nested annotations that must be described before typ.
+
+    Args:
+        typ: The type annotation being described.
+
+    Returns:
+        tuple: Union members, generic arguments or class field annotations.
+    """
+    if typ is Any or typ is type(None):
+        return ()
+    origin = get_origin(typ)
+    if hasattr(typ, "__annotations__") and not origin:
+        return tuple(getattr(typ, "__annotations__", {}).values())
+    if origin:
+        return get_args(typ)
+    return ()
+
+
+def _format_type(typ, parts: list):
+    """
+    Builds the description of typ from the descriptions of its children.
+
+    Args:
+        typ: The type annotation being described.
+        parts (list): Descriptions of the annotations from _type_children.
+
+    Returns:
+        Union[str, tuple]: A string for simple types, or (field, description)
+            pairs for user-defined classes.
+    """
+    if typ is Any:
+        return "Any"
+
+    if typ is type(None):
+        return "None"
+
+    origin = get_origin(typ)
+
+    # Union and | (UnionType in Python 3.10+)
+    if origin in (Union, types.UnionType):
+        type_names = [_thaw(part) for part in parts]
+        return " | ".join(sorted(type_names, key=lambda x: (x == "None", x)))
+
+    # Case: User-defined class
+    if hasattr(typ, "__annotations__") and not origin:
+        fields = getattr(typ, "__annotations__", {})
+        return tuple(zip(fields, parts))
+
+    # Case: Generic container like list[Class], dict[str, Class], etc.
+    if origin:
+        origin_name = (
+            origin.__name__ if hasattr(origin, "__name__") else str(origin)
+        )
+        inner_types = [_thaw(part) for part in parts]
+
+        # Special case: dict[str, SomeClass]
+        if origin is dict and len(inner_types) == 2:
+            return f"{origin_name}[{inner_types[0]}, {inner_types[1]}]"
+
+        # Case: list[SomeClass] or other single-arg generics
+        elif len(inner_types) == 1:
+            return f"{origin_name}[{inner_types[0]}]"
+
+        # Fallback for multi-arg generics like tuple[int, str]
+        else:
+            return f"{origin_name}[{', '.join(inner_types)}]"
+
+    # Case: Primitive or normal class
+    if isinstance(typ, type):
+        return typ.__name__
+
+    # Fallback: stringify (removes "typing." prefix)
+    return str(typ).replace("typing.", "")
+
+
+def _thaw(description):
+    """
+    Converts a cached type description back to the dict form exposed on
+    Workflow.input and Workflow.output.
+
+    Args:
+        description (Union[str, tuple]): A description from _type_description.
+
+    Returns:
+        Union[str, dict]: The description with class fields as dicts.
+    """
+    if isinstance(description, tuple):
+        return {name: _thaw(field) for name, field in description}
+    return description
+
 
 class Workflow:
     """
@@ -39,6 +210,16 @@ class Workflow:
             # - output: "list[str]"
     """  # noqa: E501
 
+    __slots__ = (
+        "func",
+        "name",
+        "retention_period",
+        "input",
+        "output",
+        "input_type",
+        "_handler",
+    )
+
     def __init__(self, func: Callable, retention_period: int = None):
         """
         Initialize a new Workflow instance.
@@ -56,9 +237,10 @@ class Workflow:
             falling back to Any if no type hints are provided.
         """  # noqa: E501
         self.func = func
-        self.name = func.__name__
+        self.name = sys.intern(func.__name__)
         self.retention_period = retention_period
         self.input, self.output, self.input_type = self._get_io(func)
+        self._handler = None
 
     def _convert_input(self, raw_input: Any) -> Any:
         """
@@ -115,58 +297,7 @@ class Workflow:
             >>> _get_type_description(Optional[MyClass])
             "MyClass | None"
         """
-        if typ is Any:
-            return "Any"
-
-        if typ is type(None):
-            return "None"
-
-        origin = get_origin(typ)
-        args = get_args(typ)
-
-        # Union and | (UnionType in Python 3.10+)
-        if origin in (Union, types.UnionType):
-            type_names = [self._get_type_description(arg) for arg in args]
-            return " | ".join(
-                sorted(type_names, key=lambda x: (x == "None", x))
-            )
-
-        # Case: User-defined class
-        if hasattr(typ, "__annotations__") and not origin:
-            fields = getattr(typ, "__annotations__", {})
-            return {
-                name: self._get_type_description(t)
-                for name, t in fields.items()
-            }
-
-        # Case: Generic container like list[Class], dict[str, Class], etc.
-        if origin:
-            origin_name = (
-                origin.__name__ if hasattr(origin, "__name__") else str(origin)
-            )
-
-            # Special case: dict[str, SomeClass]
-            if origin is dict and len(args) == 2:
-                key_type = self._get_type_description(args[0])
-                value_type = self._get_type_description(args[1])
-                return f"{origin_name}[{key_type}, {value_type}]"
-
-            # Case: list[SomeClass] or other single-arg generics
-            elif len(args) == 1:
-                inner_type = self._get_type_description(args[0])
-                return f"{origin_name}[{inner_type}]"
-
-            # Fallback for multi-arg generics like tuple[int, str]
-            else:
-                inner_types = [self._get_type_description(arg) for arg in args]
-                return f"{origin_name}[{', '.join(inner_types)}]"
-
-        # Case: Primitive or normal class
-        if isinstance(typ, type):
-            return typ.__name__
-
-        # Fallback: stringify (removes "typing." prefix)
-        return str(typ).replace("typing.", "")
+        return _thaw(_type_description(typ))
 
     def _get_io(self, func):
         """
@@ -185,7 +316,7 @@ class Workflow:
         Note:
             Uses _get_type_description to convert raw type hints into structured descriptions.
         """  # noqa: E501
-        hints = get_type_hints(func)
+        hints = dict(_resolved_hints(func))
         input_type = hints.get("input", Any)
         output_type = hints.get("return", Any)
 
@@ -225,7 +356,13 @@ class Workflow:
             - Supports both synchronous and asynchronous workflow functions
             - Automatically marks execution as running via InternalEndureClient
             - Converts HTTPException to EndureException for consistent error format
+            - The handler is built once per workflow and reused on later calls
         """  # noqa: E501
+        if self._handler is not None:
+            return self._handler
+
+        func = self.func
+        is_async = asyncio.iscoroutinefunction(func)
 
         async def handler(request: Request):
             try:
@@ -233,14 +370,12 @@ class Workflow:
                 if not isinstance(body, dict):
                     raise EndureException(
                         status_code=status.HTTP_400_BAD_REQUEST,
-                        output={"error": "Request body must be a JSON object"},
+                        output={"error": _BODY_NOT_OBJECT_ERROR},
                     )
                 if "execution_id" not in body or "input" not in body:
                     raise EndureException(
                         status_code=status.HTTP_400_BAD_REQUEST,
-                        output={
-                            "error": "Request must include 'execution_id' and 'input' fields"
-                        },
+                        output={"error": _MISSING_FIELDS_ERROR},
                     )
                 ctx = WorkflowContext(execution_id=body["execution_id"])
                 InternalEndureClient.mark_execution_as_running(
@@ -249,9 +384,13 @@ class Workflow:
 
                 converted_input = self._convert_input(body["input"])
 
-                output = self.func(ctx, converted_input)
-                if asyncio.iscoroutine(output):
-                    output = await output
+                if is_async:
+                    output = await func(ctx, converted_input)
+                else:
+                    output = func(ctx, converted_input)
+                    # sync callables may still hand back a coroutine
+                    if asyncio.iscoroutine(output):
+                        output = await output
 
                 # Recursively serialize all Pydantic models and dataclasses
                 serialized_output = serialize_data(output)
@@ -291,4 +430,5 @@ class Workflow:
                     },
                 )
 
+        self._handler = handler
         return handler
@@ -63,6 +63,8 @@ class DurableApp:
         """
         self.app: FastAPI = app
         self.serviceRegistry = ServiceRegistry()
+        self._discover_cache = None
+        self._discover_version = None
         self.serviceRegistry.get_router().add_api_route(
             "/discover",
             self._discover,
@@ -75,9 +77,24 @@ class DurableApp:
         """
         Handle GET requests to the "/discover" endpoint.
 
+        The response is built once and reused until the registry changes.
+
         Returns:
             dict: A dictionary containing all registered services and their workflows.
         """
+        version = self.serviceRegistry.get_version()
+        if self._discover_version != version:
+            self._discover_cache = self._build_discover()
+            self._discover_version = version
+        return self._discover_cache
+
+    def _build_discover(self):
+        """
+        Builds the "/discover" response from the registered services.
+
+        Returns:
+            list: Metadata for every registered service and its workflows.
+        """
         services = self.serviceRegistry.get_services()
         return [
             {
@@ -1,3 +1,5 @@
+import sys
+
 from app._internal import ServiceRegistry, Workflow, validate_retention_period
 from app.workflow_context import WorkflowContext
 
@@ -47,7 +49,7 @@ class Service:
             All services share the same ServiceRegistry instance, ensuring
             consistent workflow registration across the application.
         """
-        self.name = name
+        self.name = sys.intern(name) if isinstance(name, str) else name
         self.registry = ServiceRegistry()
 
     def workflow(self, **config):
@@ -16,15 +16,22 @@ class RetryMechanism(Enum):
     CONSTANT = "constant"
 
 
+# Wire values of the enums, resolved once at import time
+_LOG_STATUS_VALUES = {s: s.value for s in LogStatus}
+_RETRY_MECHANISM_VALUES = {m: m.value for m in RetryMechanism}
+
+
 def log_to_dict(log: "Log") -> dict:
     """Convert a Log instance to a dictionary with proper enum handling"""
     return {
-        "status": log.status.value if log.status else None,
+        "status": _LOG_STATUS_VALUES[log.status] if log.status else None,
         "input": log.input,
         "output": log.output,
         "max_retries": log.max_retries,
         "retry_method": (
-            log.retry_mechanism.value if log.retry_mechanism else None
+            _RETRY_MECHANISM_VALUES[log.retry_mechanism]
+            if log.retry_mechanism
+            else None
         ),
         "timestamp": (
             log.timestamp.replace(tzinfo=timezone.utc).isoformat()
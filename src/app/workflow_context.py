@@ -1,6 +1,12 @@
+from __future__ import annotations
+
 import asyncio
+import functools
 import logging
 import time
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Optional
 
 import requests
 from fastapi import status
@@ -10,6 +16,30 @@ from app._internal.internal_client import InternalEndureClient
 from app._internal.utils import serialize_data
 from app.types import EndureException, Log, LogStatus, RetryMechanism
 
+# Base delay of the local retry schedule, used when the engine omits retry_at
+_BACKOFF_BASE_SECONDS = 1.0
+# Longest delay the local retry schedule will wait between two attempts
+_BACKOFF_MAX_SECONDS = 60.0
+
+# Error messages for the terminal failure paths; each raise builds its own
+# output dict around them so no two exceptions share a mutable output
+_PAUSED_ERROR = "Execution Paused or Terminated"
+_MAX_RETRIES_ERROR = "Action failed after reaching max retries"
+
+# Read-only stand-in for a missing engine payload
+_EMPTY_PAYLOAD = MappingProxyType({})
+
+# Process pool for cpu_bound actions, created on first use
+_cpu_pool = None
+
+
+def _get_cpu_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool used for cpu_bound actions."""
+    global _cpu_pool
+    if _cpu_pool is None:
+        _cpu_pool = ProcessPoolExecutor()
+    return _cpu_pool
+
 
 class WorkflowContext:
     """
@@ -39,7 +69,19 @@ class WorkflowContext:
             )
             return result
         ```
-    """
+
+    Independent actions can run concurrently by awaiting them together; each
+    one is still logged and retried on its own, and synchronous actions run in
+    worker threads, so the workflow takes as long as its slowest branch:
+        ```python
+        payment, reservation = await asyncio.gather(
+            ctx.execute_action(process_payment, payment_input, 3, RetryMechanism.LINEAR),
+            ctx.execute_action(reserve_inventory, inventory_input, 3, RetryMechanism.LINEAR),
+        )
+        ```
+    """  # noqa: E501
+
+    __slots__ = ("execution_id",)
 
     def __init__(self, execution_id: str):
         """
@@ -57,12 +99,15 @@ class WorkflowContext:
 
     async def execute_action(
         self,
-        action: callable,
-        input_data,
+        action: Callable[[Any], Any],
+        input_data: Any,
         max_retries: int,
         retry_mechanism: RetryMechanism,
-        action_name: str = None,
-    ) -> any:
+        action_name: Optional[str] = None,
+        cpu_bound: bool = False,
+        timeout: Optional[float] = None,
+        overlap_timed_out: bool = False,
+    ) -> Any:
         """
         Execute an action with durability guarantees and automatic retry capabilities.
 
@@ -79,7 +124,9 @@ class WorkflowContext:
 
         Retry Behavior:
         - Retries are managed by the durable engine
-        - Sleep duration between retries is determined by retry_mechanism
+        - Sleep duration between retries is the engine's retry_at; if the engine
+          accepts the FAILED log (201/200) without one, the delay is computed
+          locally from retry_mechanism, capped, for at most max_retries retries
         - Retries continue until success or max_retries is reached
 
         Args:
@@ -92,6 +139,19 @@ class WorkflowContext:
                                             etc.
             action_name (str, optional): Custom name for the action in logs. If not provided,
                                        uses action.__name__.
+            cpu_bound (bool, optional): Run a synchronous action in a process pool instead of
+                                      a worker thread, for CPU-heavy work. The action and its
+                                      input must be picklable. Default is False.
+            timeout (float, optional): Maximum number of seconds a single attempt may run.
+                                     An attempt that exceeds it fails with TimeoutError and
+                                     follows the normal retry path. A timed-out coroutine
+                                     is cancelled. A timed-out synchronous action cannot be
+                                     interrupted, so the timeout is only reported once it
+                                     has finished. Default is None (no limit).
+            overlap_timed_out (bool, optional): Report the timeout of a synchronous action
+                                              straight away and let the next attempt start
+                                              while the timed-out one is still running. Only
+                                              safe for idempotent actions. Default is False.
 
         Returns:
             any: Either:
@@ -102,9 +162,10 @@ class WorkflowContext:
         Raises:
             RuntimeError: If:
                 - Engine communication fails
-                - Action fails and max retries are exhausted
-                - retry_at time is missing from engine response
+                - retry_at time is missing from an unexpected engine response
                 - Any unhandled exception during execution
+            EndureException: If max retries are exhausted or the execution was
+                paused or terminated.
 
         Communication with Engine:
         - Uses InternalEndureClient.send_log for state updates
@@ -135,11 +196,22 @@ class WorkflowContext:
             max_retries=max_retries,
         )
         name = action_name if action_name is not None else action.__name__
-        logging.info("Sending log for action: {}".format(log))
+        call_action = functools.partial(
+            self._call_action,
+            action,
+            input_data,
+            cpu_bound,
+            timeout,
+            overlap_timed_out,
+        )
+        # Replays of completed actions return straight after this first
+        # call, so the logging on this path is lazy: the log and response
+        # are only formatted when INFO is enabled
+        logging.info("Sending log for action: %s", log)
         engine_response = InternalEndureClient.send_log(
             self.execution_id, log, name
         )
-        logging.info("Engine response: {}".format(engine_response))
+        logging.info("Engine response: %s", engine_response)
         if not engine_response:
             logging.error(
                 "CRITICAL ERROR: Engine response is None or empty. "
@@ -149,182 +221,308 @@ class WorkflowContext:
                 "Base URL is not set in environment variables or missing required parameters (log or action_name)."
             )
 
+        status_code = engine_response["status_code"]
         logging.info(
-            f"Detailed engine response - Status: {engine_response.get('status_code')}, "
-            f"Payload: {engine_response.get('payload')}, "
-            f"Headers: {engine_response.get('headers', {})}"
+            "Detailed engine response - Status: %s, Payload: %s, Headers: %s",
+            status_code,
+            engine_response.get("payload"),
+            engine_response.get("headers"),
         )
 
-        status_code = engine_response["status_code"]
-        logging.info(f"Processing status code: {status_code}")
+        handler = _STATUS_HANDLERS.get(status_code)
+        if handler is None:
+            logging.error(
+                "UNEXPECTED STATUS CODE: %s. Full response: %s",
+                status_code,
+                engine_response,
+            )
+            raise RuntimeError(
+                f"Unexpected status code {status_code} from engine: {engine_response}"
+            )
+        return await handler(
+            self,
+            engine_response,
+            action,
+            name,
+            retry_mechanism,
+            max_retries,
+            call_action,
+        )
+
+    async def _call_action(
+        self,
+        action: Callable[[Any], Any],
+        input_data: Any,
+        cpu_bound: bool,
+        timeout: Optional[float],
+        overlap_timed_out: bool,
+    ) -> Any:
+        """
+        Run one attempt of the action without blocking the event loop.
 
-        match status_code:
-            case status.HTTP_201_CREATED | status.HTTP_200_OK:
+        Coroutine functions are awaited directly. Synchronous actions run in a
+        worker thread, or in a process pool when cpu_bound is set. The attempt
+        is bounded by timeout when one is given; a TimeoutError raised by the
+        action itself is passed through unchanged.
+        """
+        is_coroutine = asyncio.iscoroutinefunction(action)
+        if is_coroutine:
+            attempt = asyncio.ensure_future(action(input_data))
+        elif cpu_bound:
+            loop = asyncio.get_running_loop()
+            attempt = loop.run_in_executor(_get_cpu_pool(), action, input_data)
+        else:
+            attempt = asyncio.ensure_future(
+                asyncio.to_thread(action, input_data)
+            )
+        if timeout is None:
+            return await attempt
+        try:
+            done, _ = await asyncio.wait({attempt}, timeout=timeout)
+        except asyncio.CancelledError:
+            attempt.cancel()
+            raise
+        if done:
+            return attempt.result()
+
+        if is_coroutine:
+            attempt.cancel()
+            await asyncio.wait({attempt})
+        elif overlap_timed_out:
+            attempt.add_done_callback(_discard_outcome)
+        else:
+            logging.warning(
+                "Action %s timed out after %s seconds; waiting for the "
+                "attempt to finish before retrying",
+                action.__name__,
+                timeout,
+            )
+            await asyncio.wait({attempt})
+        _discard_outcome(attempt)
+        raise TimeoutError(
+            f"Action {action.__name__} timed out after {timeout} seconds"
+        )
+
+    async def _run_action(
+        self,
+        engine_response: dict,
+        action: Callable[[Any], Any],
+        name: str,
+        retry_mechanism: RetryMechanism,
+        max_retries: int,
+        call_action: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Execute the action, logging its outcome and retrying on failure.
+
+        Used when the engine answers the STARTED log with 201/200.
+        """
+        status_code = engine_response["status_code"]
+        logging.info(
+            "Status %s - Proceeding with action execution", status_code
+        )
+        # retry_at is wall-clock time; map it onto the loop's monotonic clock
+        # once so NTP adjustments during a long sleep don't skew retries
+        loop = asyncio.get_running_loop()
+        clock_offset = time.time() - loop.time()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                logging.info("Executing action: %s", action.__name__)
+                result = await call_action()
+                logging.info("Action result: %s", result)
+            except (ValueError, ValidationError) as e:
+                logging.error(
+                    "VALIDATION ERROR in action %s: %s: %s",
+                    action.__name__,
+                    type(e).__name__,
+                    e,
+                )
+                engine_response = InternalEndureClient.send_log(
+                    self.execution_id,
+                    Log(
+                        status=LogStatus.FAILED,
+                        output=serialize_data({"error": str(e)}),
+                    ),
+                    name,
+                )
                 logging.info(
-                    f"Status {status_code} - Proceeding with action execution"
+                    "Engine response after validation error: %s",
+                    engine_response,
                 )
-                while True:
-                    try:
-                        try:
-                            logging.info(
-                                "Executing action: {}".format(action.__name__)
-                            )
-                            if asyncio.iscoroutinefunction(action):
-                                result = await action(input_data)
-                            else:
-                                result = action(input_data)
-                            logging.info("Action result: {}".format(result))
-                        except (ValueError, ValidationError) as e:
-                            logging.error(
-                                f"VALIDATION ERROR in action {action.__name__}: {type(e).__name__}: {e}"
-                            )
-                            engine_response = InternalEndureClient.send_log(
-                                self.execution_id,
-                                Log(
-                                    status=LogStatus.FAILED,
-                                    output=serialize_data({"error": str(e)}),
-                                ),
-                                name,
-                            )
-                            logging.info(
-                                "Engine response after validation error: {}".format(
-                                    engine_response
-                                )
-                            )
-                            logging.error(
-                                f"WORKFLOW DEBUG: About to raise exception of type {type(e)}: {e}"
-                            )
-                            raise
-                        log = Log(
-                            status=LogStatus.COMPLETED,
-                            output=serialize_data(result),
-                        )
-                        logging.info(
-                            "Sending log for completed action: {}".format(log)
-                        )
-                        engine_response = InternalEndureClient.send_log(
-                            self.execution_id,
-                            log,
-                            name,
-                        )
-                        logging.info(
-                            "Engine response after completion: {}".format(
-                                engine_response
-                            )
-                        )
-                        logging.info("Returning result: {}".format(result))
-                        return result
-                    except (
-                        ValueError,
-                        ValidationError,
-                        requests.exceptions.RequestException,
-                    ) as e:
-                        logging.error(
-                            f"CRITICAL ERROR: Caught exception of type {type(e)}: {e}"
-                        )
-                        logging.error(
-                            f"Exception details - Args: {e.args}, Traceback: {type(e).__name__}"
-                        )
-                        raise
-                    except Exception as e:
-                        logging.error(
-                            f"UNEXPECTED ERROR in action {action.__name__}: {type(e).__name__}: {e}"
-                        )
+                raise
+            except requests.exceptions.RequestException as e:
+                logging.error(
+                    "NETWORK ERROR in action %s: %s: %s",
+                    action.__name__,
+                    type(e).__name__,
+                    e,
+                )
+                raise
+            except Exception as e:
+                logging.error(
+                    "UNEXPECTED ERROR in action %s: %s: %s",
+                    action.__name__,
+                    type(e).__name__,
+                    e,
+                )
+                log = Log(
+                    status=LogStatus.FAILED,
+                    output=serialize_data({"error": str(e)}),
+                )
+                logging.info("Sending log for failed action: %s", log)
+                engine_response = InternalEndureClient.send_log(
+                    self.execution_id, log, name
+                )
+                logging.info(
+                    "Engine response after failure: %s", engine_response
+                )
+                engine_status = engine_response.get("status_code")
+                logging.info("Engine status after failure: %s", engine_status)
+
+                if engine_status in [
+                    status.HTTP_400_BAD_REQUEST,
+                    status.HTTP_404_NOT_FOUND,
+                    status.HTTP_409_CONFLICT,
+                ]:
+                    logging.error(
+                        "ENGINE ERROR: Received %s from engine. "
+                        "Original error: %s: %s",
+                        engine_status,
+                        type(e).__name__,
+                        e,
+                    )
+                    if engine_status == status.HTTP_409_CONFLICT:
                         logging.error(
-                            f"Error details - Args: {e.args}, Traceback: {type(e).__name__}"
-                        )
-                        log = Log(
-                            status=LogStatus.FAILED,
-                            output=serialize_data({"error": str(e)}),
+                            "Execution Paused or Terminated , no retries will be attempted."
                         )
-                        logging.info(
-                            "Sending log for failed action: {}".format(log)
+                        raise EndureException(
+                            status_code=engine_status,
+                            output={"error": _PAUSED_ERROR},
                         )
-                        engine_response = InternalEndureClient.send_log(
-                            self.execution_id, log, name
-                        )
-                        logging.info(
-                            "Engine response after failure: {}".format(
-                                engine_response
-                            )
-                        )
-                        engine_status = engine_response.get("status_code")
-                        logging.info(
-                            f"Engine status after failure: {engine_status}"
+                    raise EndureException(
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        output={"error": _MAX_RETRIES_ERROR},
+                    )
+                payload = engine_response.get("payload") or _EMPTY_PAYLOAD
+                retry_at_unix = payload.get("retry_at")
+                logging.info("Retry at unix: %s", retry_at_unix)
+                if retry_at_unix:
+                    sleep_seconds = retry_at_unix - clock_offset - loop.time()
+                    if sleep_seconds > 0:
+                        logging.info("Sleeping for %s seconds", sleep_seconds)
+                        await asyncio.sleep(sleep_seconds)
+                    else:
+                        logging.warning(
+                            "Retry time %s is in the past. Current time: %s",
+                            retry_at_unix,
+                            clock_offset + loop.time(),
                         )
+                elif engine_status not in (
+                    status.HTTP_201_CREATED,
+                    status.HTTP_200_OK,
+                ):
+                    logging.error(
+                        "CRITICAL ERROR: No retry_at time provided by engine "
+                        "for retryable status %s. Engine response: %s",
+                        engine_status,
+                        engine_response,
+                    )
+                    raise RuntimeError(
+                        f"Engine did not provide retry_at time for retryable status {engine_status}. "
+                        f"Response: {engine_response}"
+                    )
+                elif attempt > max_retries:
+                    logging.error(
+                        "Action %s failed after %s local retries",
+                        action.__name__,
+                        max_retries,
+                    )
+                    raise EndureException(
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        output={"error": _MAX_RETRIES_ERROR},
+                    )
+                else:
+                    sleep_seconds = _compute_backoff(attempt, retry_mechanism)
+                    logging.warning(
+                        "No retry_at time provided by engine for retryable "
+                        "status %s. Falling back to local %s backoff of %s "
+                        "seconds",
+                        engine_status,
+                        retry_mechanism,
+                        sleep_seconds,
+                    )
+                    await asyncio.sleep(sleep_seconds)
+                continue
 
-                        if engine_status in [
-                            status.HTTP_400_BAD_REQUEST,
-                            status.HTTP_404_NOT_FOUND,
-                            status.HTTP_409_CONFLICT,
-                        ]:
-                            logging.error(
-                                f"ENGINE ERROR: Received {engine_status} from engine. "
-                                f"Original error: {type(e).__name__}: {e}"
-                            )
-                            if engine_status == status.HTTP_409_CONFLICT:
-                                logging.error(
-                                    "Execution Paused or Terminated , no retries will be attempted."
-                                )
-                                raise EndureException(
-                                    status_code=engine_status,
-                                    output=serialize_data(
-                                        {
-                                            "error": str(
-                                                "Execution Paused or Terminated"
-                                            )
-                                        }
-                                    ),
-                                )
-                            raise EndureException(
-                                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                                output=serialize_data(
-                                    {
-                                        "error": str(
-                                            "Action failed after reaching max retries"
-                                        )
-                                    }
-                                ),
-                            )
-                        retry_at_unix = engine_response.get("payload", {}).get(
-                            "retry_at"
-                        )
-                        logging.info("Retry at unix: {}".format(retry_at_unix))
-                        if retry_at_unix:
-                            sleep_seconds = retry_at_unix - time.time()
-                            if sleep_seconds > 0:
-                                logging.info(
-                                    "Sleeping for {} seconds".format(
-                                        sleep_seconds
-                                    )
-                                )
-                                time.sleep(sleep_seconds)
-                            else:
-                                logging.warning(
-                                    f"Retry time {retry_at_unix} is in the past. "
-                                    f"Current time: {time.time()}"
-                                )
-                        else:
-                            logging.error(
-                                f"CRITICAL ERROR: No retry_at time provided by "
-                                f"engine for retryable status {engine_status}. "
-                                f"Engine response: {engine_response}"
-                            )
-                            raise RuntimeError(
-                                f"Engine did not provide retry_at time for retryable status {engine_status}. "
-                                f"Response: {engine_response}"
-                            )
-            case status.HTTP_208_ALREADY_REPORTED:
-                logging.info(
-                    "Returning cached result: {}".format(engine_response)
-                )
-                output = engine_response.get("payload", {}).get("output")
-                return output if output else {}
-            case _:
-                logging.error(
-                    f"UNEXPECTED STATUS CODE: {status_code}. "
-                    f"Full response: {engine_response}"
-                )
-                raise RuntimeError(
-                    f"Unexpected status code {status_code} from engine: {engine_response}"
-                )
+            log = Log(
+                status=LogStatus.COMPLETED,
+                output=serialize_data(result),
+            )
+            logging.info("Sending log for completed action: %s", log)
+            engine_response = InternalEndureClient.send_log(
+                self.execution_id,
+                log,
+                name,
+            )
+            logging.info(
+                "Engine response after completion: %s", engine_response
+            )
+            logging.info("Returning result: %s", result)
+            return result
+
+    async def _return_cached(
+        self,
+        engine_response: dict,
+        action: Callable[[Any], Any],
+        name: str,
+        retry_mechanism: RetryMechanism,
+        max_retries: int,
+        call_action: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return the result recorded by the engine for an already completed action.
+
+        Used when the engine answers the STARTED log with 208.
+        """
+        logging.info("Returning cached result: %s", engine_response)
+        payload = engine_response.get("payload") or _EMPTY_PAYLOAD
+        output = payload.get("output")
+        return output if output else {}
+
+
+def _discard_outcome(attempt: asyncio.Future) -> None:
+    """Mark a finished, timed-out attempt's exception as retrieved."""
+    if attempt.done() and not attempt.cancelled():
+        attempt.exception()
+
+
+def _compute_backoff(attempt: int, retry_mechanism: RetryMechanism) -> float:
+    """
+    Compute the delay before the next retry, mirroring the engine's schedule.
+
+    The delay never exceeds _BACKOFF_MAX_SECONDS.
+
+    Args:
+        attempt (int): The number of the attempt that just failed, starting at 1.
+        retry_mechanism (RetryMechanism): The retry strategy of the action.
+
+    Returns:
+        float: The number of seconds to wait before retrying.
+    """
+    if retry_mechanism is RetryMechanism.EXPONENTIAL:
+        delay = _BACKOFF_BASE_SECONDS * 2 ** (attempt - 1)
+    elif retry_mechanism is RetryMechanism.LINEAR:
+        delay = _BACKOFF_BASE_SECONDS * attempt
+    else:
+        delay = _BACKOFF_BASE_SECONDS
+    return min(delay, _BACKOFF_MAX_SECONDS)
+
+
+# Dispatch table from the engine's reply to the STARTED log to the handler
+_STATUS_HANDLERS = {
+    status.HTTP_201_CREATED: WorkflowContext._run_action,
+    status.HTTP_200_OK: WorkflowContext._run_action,
+    status.HTTP_208_ALREADY_REPORTED: WorkflowContext._return_cached,
+}
@@ -1,86 +1,139 @@
+import asyncio
 import os
-from unittest.mock import AsyncMock, Mock, patch
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
 
 import pytest
+import requests
+from fastapi import status
+from requests.adapters import BaseAdapter
 
-from app import (
-    DurableApp,
-    Log,
-    LogStatus,
-    Response,
-    RetryMechanism,
-    Service,
-    WorkflowContext,
-)
+from app import Log, LogStatus, RetryMechanism, WorkflowContext
 from app._internal import InternalEndureClient, ServiceRegistry
 
-
-def setup_module(module):
-    """Setup module-level test environment"""
-    os.environ["DURABLE_ENGINE_BASE_URL"] = "http://test-engine:8000"
-    InternalEndureClient._base_url = "http://test-engine:8000"
+# Built once and shared; tests only read these
+_SAMPLE_LOG = Log(
+    status=LogStatus.STARTED,
+    input={"test": "data"},
+    max_retries=3,
+    retry_mechanism=RetryMechanism.EXPONENTIAL,
+)
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def cleanup_test_env():
-    """Setup and cleanup test environment for each test"""
+    """Setup the engine URL once for the session and clean it up at the end.
+    Tests that need it unset should use monkeypatch so it is restored."""
     os.environ["DURABLE_ENGINE_BASE_URL"] = "http://test-engine:8000"
     InternalEndureClient._base_url = "http://test-engine:8000"
 
     yield
 
-    if "DURABLE_ENGINE_BASE_URL" in os.environ:
-        del os.environ["DURABLE_ENGINE_BASE_URL"]
+    os.environ.pop("DURABLE_ENGINE_BASE_URL", None)
     InternalEndureClient._base_url = None
 
 
-# This fixture provides a fresh App instance for each test that needs it
-@pytest.fixture
-def app():
-    app_instance = DurableApp()
-    yield app_instance
+class StubEngineAdapter(BaseAdapter):
+    """
+    Transport adapter that answers every request with a canned response, so
+    tests exercise the real session without patching it.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.reset()
+
+    def reset(self):
+        self.status_code = status.HTTP_201_CREATED
+        self.content = b"{}"
+        self.error = None
+        self.requests = []
+
+    @property
+    def last_request(self) -> requests.PreparedRequest:
+        return self.requests[-1]
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        if self.error is not None:
+            raise self.error
+        response = requests.Response()
+        response.status_code = self.status_code
+        response._content = self.content
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _engine_adapter(cleanup_test_env):
+    """Route every engine call made through the shared session to a stub,
+    mounted once so engine calls never reach the network"""
+    session = InternalEndureClient._get_session()
+    prefix = InternalEndureClient._base_url
+    adapter = StubEngineAdapter()
+    session.mount(prefix, adapter)
+    yield adapter
+    session.adapters.pop(prefix)
 
 
-@pytest.fixture
-def service():
-    service_instance = Service()
-    yield service_instance
+@pytest.fixture(autouse=True)
+def engine(_engine_adapter):
+    """The session's stub engine, reset to a 201 with an empty body before
+    every test, whether or not the test asks for it"""
+    _engine_adapter.reset()
+    return _engine_adapter
 
 
 @pytest.fixture
 def workflow_context():
-    context = WorkflowContext("test-execution-id")
-    yield context
+    return WorkflowContext("test-execution-id")
 
 
 @pytest.fixture
-def mock_internal_client():
-    """Mock both requests and InternalEndureClient to prevent real HTTP calls"""
-    http_response = Mock()
-    http_response.status_code = 201
-    http_response.json.return_value = {}
-
-    # Blocking actual HTTP requests by mocking requests.patch
-    with patch("requests.patch", return_value=http_response):
-        with patch(
-            "app._internal.workflow.InternalEndureClient"
-        ) as MockClient:
-            MockClient.send_log = Mock()
-            MockClient.send_log.side_effect = [
-                Response(status_code=201, payload={}).to_dict(),
-                Response(status_code=200, payload={}).to_dict(),
-            ]
-        yield MockClient
+def mock_send_log(monkeypatch):
+    """Replace InternalEndureClient.send_log for the duration of a test"""
+    mock = Mock()
+    monkeypatch.setattr(InternalEndureClient, "send_log", mock)
+    return mock
 
 
 @pytest.fixture
-async def mock_request():
+def no_sleep(monkeypatch):
+    """Make asyncio.sleep return immediately so retry waits cost no time"""
     mock = AsyncMock()
-    mock.json = AsyncMock()
+    monkeypatch.setattr(asyncio, "sleep", mock)
     return mock
 
 
 @pytest.fixture
+def frozen_time(monkeypatch):
+    """Pin time.time() to a fixed instant; tests may move now[0] forward"""
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def mock_request():
+    """Minimal request stub; set mock_request.json.data to the body, or
+    mock_request.json.error to make reading it fail"""
+
+    async def json():
+        if json.error is not None:
+            raise json.error
+        return json.data
+
+    json.data = {}
+    json.error = None
+    return SimpleNamespace(json=json)
+
+
+@pytest.fixture(scope="session")
 def sample_action():
     def action(input_data):
         return {"result": input_data}
@@ -90,12 +143,7 @@ def sample_action():
 
 @pytest.fixture
 def sample_log():
-    return Log(
-        status=LogStatus.STARTED,
-        input={"test": "data"},
-        max_retries=3,
-        retry_mechanism=RetryMechanism.EXPONENTIAL,
-    )
+    return _SAMPLE_LOG
 
 
 @pytest.fixture(autouse=True)
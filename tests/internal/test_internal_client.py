@@ -1,13 +1,28 @@
-import os
-from unittest.mock import patch
+import json
+from types import SimpleNamespace
 
 import pytest
+import requests
 from fastapi import status
+from requests.adapters import HTTPAdapter
 
-from app._internal.internal_client import InternalEndureClient
+from app._internal.internal_client import _POOL_SIZE, InternalEndureClient
 from app.types import Log, LogStatus, Response
 
 
+@pytest.fixture(scope="session")
+def urls():
+    """Engine URLs and headers the client is expected to use"""
+    execution_url = (
+        f"{InternalEndureClient._base_url}/executions/test-execution-id"
+    )
+    return SimpleNamespace(
+        log=f"{execution_url}/log/test_action",
+        started=f"{execution_url}/started",
+        content_type="application/json",
+    )
+
+
 class TestInternalClient:
 
     @pytest.fixture
@@ -17,126 +32,105 @@ class TestInternalClient:
             payload={"message": "Log sent successfully"},
         )
 
-    def test_send_log_success(self, sample_log, mock_response):
+    def test_send_log_success(self, engine, urls, sample_log, mock_response):
         """Test successful log sending with proper response handling"""
-        with patch("requests.patch") as mock_patch:
-            mock_patch.return_value.status_code = status.HTTP_201_CREATED
-            mock_patch.return_value.json.return_value = mock_response.payload
+        engine.content = json.dumps(mock_response.payload).encode()
 
-            result = InternalEndureClient.send_log(
-                execution_id="test-execution-id",
-                log=sample_log,
-                action_name="test_action",
-            )
+        result = InternalEndureClient.send_log(
+            execution_id="test-execution-id",
+            log=sample_log,
+            action_name="test_action",
+        )
 
-            mock_patch.assert_called_once()
-            call_args = mock_patch.call_args
-            assert (
-                call_args[0][0]
-                == f"{InternalEndureClient._base_url}/executions/test-execution-id/log/test_action"
-            )
-            assert call_args[1]["headers"] == {
-                "Content-Type": "application/json"
-            }
-            assert call_args[1]["json"] == sample_log.to_dict()
+        assert len(engine.requests) == 1
+        request = engine.last_request
+        assert request.method == "PATCH"
+        assert request.url == urls.log
+        assert request.headers["Content-Type"] == urls.content_type
+        assert json.loads(request.body) == sample_log.to_dict()
 
-            assert result["status_code"] == status.HTTP_201_CREATED
-            assert result["payload"] == mock_response.payload
+        assert result["status_code"] == status.HTTP_201_CREATED
+        assert result["payload"] == mock_response.payload
 
-    def test_send_log_missing_env_var(self):
+    def test_send_log_missing_env_var(self, monkeypatch):
         """Test error handling when DURABLE_ENGINE_BASE_URL is not set"""
-        # temporarily remove the environment variable for this test
-        original_url = os.environ.pop("DURABLE_ENGINE_BASE_URL", None)
-        original_base_url = InternalEndureClient._base_url
-        InternalEndureClient._base_url = None
-
-        try:
-            with pytest.raises(ValueError) as exc_info:
-                InternalEndureClient.send_log(
-                    execution_id="test-execution-id",
-                    log=Log(status=LogStatus.STARTED),
-                    action_name="test_action",
-                )
-            assert "DURABLE_ENGINE_BASE_URL is not set" in str(exc_info.value)
-        finally:
-            # restoring the environment variable and base_url
-            if original_url:
-                os.environ["DURABLE_ENGINE_BASE_URL"] = original_url
-            InternalEndureClient._base_url = original_base_url
-
-    def test_send_log_invalid_inputs(self):
-        """Test error handling for invalid input parameters"""
-        # none log
+        monkeypatch.delenv("DURABLE_ENGINE_BASE_URL", raising=False)
+        monkeypatch.setattr(InternalEndureClient, "_base_url", None)
+
         with pytest.raises(ValueError) as exc_info:
             InternalEndureClient.send_log(
                 execution_id="test-execution-id",
-                log=None,
+                log=Log(status=LogStatus.STARTED),
                 action_name="test_action",
             )
-        assert "log and action_name must be provided" in str(exc_info.value)
-
-        # empty action_name
-        with pytest.raises(ValueError) as exc_info:
+        assert "DURABLE_ENGINE_BASE_URL is not set" in str(exc_info.value)
+
+    @pytest.mark.parametrize(
+        "log,action_name",
+        [
+            (None, "test_action"),
+            (Log(status=LogStatus.STARTED), ""),
+        ],
+        ids=["none_log", "empty_action_name"],
+    )
+    def test_send_log_invalid_inputs(self, log, action_name):
+        """Test error handling for invalid input parameters"""
+        with pytest.raises(
+            ValueError, match="log and action_name must be provided"
+        ):
             InternalEndureClient.send_log(
                 execution_id="test-execution-id",
-                log=Log(status=LogStatus.STARTED),
-                action_name="",
+                log=log,
+                action_name=action_name,
             )
-        assert "log and action_name must be provided" in str(exc_info.value)
 
-    def test_send_log_http_error(self, sample_log):
+    def test_send_log_http_error(self, engine, sample_log):
         """Test handling of HTTP errors from the engine"""
-        with patch("requests.patch") as mock_patch:
-            mock_patch.side_effect = Exception("HTTP Error")
-
-            with pytest.raises(Exception) as exc_info:
-                InternalEndureClient.send_log(
-                    execution_id="test-execution-id",
-                    log=sample_log,
-                    action_name="test_action",
-                )
-            assert "HTTP Error" in str(exc_info.value)
-
-    def test_mark_execution_as_running_success(self):
-        """Test successful execution marking"""
-        with patch("requests.patch") as mock_patch:
-            mock_patch.return_value.status_code = status.HTTP_200_OK
-            mock_patch.return_value.json.return_value = {}
+        engine.error = requests.exceptions.ConnectionError("HTTP Error")
 
-            result = InternalEndureClient.mark_execution_as_running(
-                "test-execution-id"
-            )
-
-            mock_patch.assert_called_once()
-            call_args = mock_patch.call_args
-            assert (
-                call_args[0][0]
-                == f"{InternalEndureClient._base_url}/executions/test-execution-id/started"
+        with pytest.raises(Exception) as exc_info:
+            InternalEndureClient.send_log(
+                execution_id="test-execution-id",
+                log=sample_log,
+                action_name="test_action",
             )
-            assert call_args[1]["headers"] == {
-                "Content-Type": "application/json"
-            }
+        assert "HTTP Error" in str(exc_info.value)
 
-            assert result["status_code"] == status.HTTP_200_OK
-            assert result["payload"] == {}
+    def test_mark_execution_as_running_success(self, engine, urls):
+        """Test successful execution marking"""
+        engine.status_code = status.HTTP_200_OK
 
-    def test_send_log_empty_body(self, sample_log):
-        """Test handling of 200 OK with empty body (non-JSON)."""
+        result = InternalEndureClient.mark_execution_as_running(
+            "test-execution-id"
+        )
 
-        class MockResponse:
-            status_code = 200
+        assert len(engine.requests) == 1
+        request = engine.last_request
+        assert request.url == urls.started
+        assert request.headers["Content-Type"] == urls.content_type
 
-            def raise_for_status(self):
-                pass
+        assert result["status_code"] == status.HTTP_200_OK
+        assert result["payload"] == {}
 
-            def json(self):
-                raise ValueError("No JSON")
+    def test_send_log_empty_body(self, engine, sample_log):
+        """Test handling of 200 OK with empty body (non-JSON)."""
+        engine.status_code = status.HTTP_200_OK
+        engine.content = b""
 
-        with patch("requests.patch", return_value=MockResponse()):
-            result = InternalEndureClient.send_log(
-                execution_id="test-execution-id",
-                log=sample_log,
-                action_name="test_action",
-            )
-            assert result["status_code"] == 200
-            assert result["payload"] == {}
+        result = InternalEndureClient.send_log(
+            execution_id="test-execution-id",
+            log=sample_log,
+            action_name="test_action",
+        )
+        assert result["status_code"] == 200
+        assert result["payload"] == {}
+
+    def test_session_is_reused_across_calls(self):
+        """Test that all engine calls go through one pooled session"""
+        session = InternalEndureClient._get_session()
+        assert InternalEndureClient._get_session() is session
+        for prefix in ("http://", "https://"):
+            adapter = session.adapters[prefix]
+            assert isinstance(adapter, HTTPAdapter)
+            assert adapter._pool_connections == _POOL_SIZE
+            assert adapter._pool_maxsize == _POOL_SIZE
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Dict
 
 import pytest
@@ -7,6 +8,17 @@ from app._internal.service_registry import ServiceRegistry
 from app._internal.workflow import Workflow, WorkflowContext
 
 
+@lru_cache(maxsize=None)
+def _make_workflow(index: int):
+    """Builds a distinctly named workflow function, reused across tests"""
+
+    def workflow(ctx: WorkflowContext, input: Dict) -> Dict:
+        return {"result": f"success{index}"}
+
+    workflow.__name__ = f"workflow{index}"
+    return workflow
+
+
 class TestServiceRegistry:
     @pytest.fixture(autouse=True)
     def setup_method(self):
@@ -48,30 +60,19 @@ class TestServiceRegistry:
         assert routes[0].path == f"/execute/{service_name}/{workflow.name}"
         assert "POST" in routes[0].methods
 
-    def test_get_services(self):
+    @pytest.mark.parametrize("count", [1, 2, 5])
+    def test_get_services(self, count):
 
         registry = ServiceRegistry()
-        service_name1 = "service1"
-        service_name2 = "service2"
-
-        def workflow1(ctx: WorkflowContext, input: Dict) -> Dict:
-            return {"result": "success1"}
-
-        def workflow2(ctx: WorkflowContext, input: Dict) -> Dict:
-            return {"result": "success2"}
-
-        w1 = Workflow(workflow1)
-        w2 = Workflow(workflow2)
+        workflows = [Workflow(_make_workflow(i)) for i in range(count)]
 
-        registry.register_workflow(service_name1, w1)
-        registry.register_workflow(service_name2, w2)
+        for i, workflow in enumerate(workflows):
+            registry.register_workflow(f"service{i}", workflow)
 
         services = registry.get_services()
-        assert len(services) == 2
-        assert service_name1 in services
-        assert service_name2 in services
-        assert services[service_name1][0].name == workflow1.__name__
-        assert services[service_name2][0].name == workflow2.__name__
+        assert len(services) == count
+        for i in range(count):
+            assert services[f"service{i}"][0].name == f"workflow{i}"
 
     def test_get_router(self):
 
@@ -107,3 +108,15 @@ class TestServiceRegistry:
             ValueError, match="Workflow with name .* already exists"
         ):
             self.registry.register_workflow(service_name, w2)
+
+    def test_version_changes_on_register_and_clear(self):
+        def workflow(ctx: WorkflowContext, input: Dict) -> Dict:
+            return {}
+
+        version = self.registry.get_version()
+        self.registry.register_workflow("test_service", Workflow(workflow))
+        assert self.registry.get_version() != version
+
+        version = self.registry.get_version()
+        self.registry.clear()
+        assert self.registry.get_version() != version
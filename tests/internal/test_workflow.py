@@ -1,10 +1,9 @@
-from typing import Any
-from unittest.mock import AsyncMock, patch
+from typing import Any, get_type_hints
+from unittest.mock import patch
 
 import pytest
-from fastapi import HTTPException
+from fastapi import HTTPException, Request
 from pydantic import BaseModel
-from starlette.responses import Response
 
 from app._internal.workflow import Workflow
 from app.types import EndureException
@@ -28,45 +27,108 @@ class OutputModel:
         self.timestamps = timestamps or []
 
 
-class TestWorkflow:
+def typed_workflow(ctx: WorkflowContext, input: dict) -> dict:
+    return {"message": input["name"]}
 
-    @pytest.fixture
-    def mock_request(self):
-        return AsyncMock()
 
-    @staticmethod
-    def sync_workflow(ctx: WorkflowContext, input: dict) -> str:
-        return f"Hello, {input['name']}!"
+def untyped_workflow(ctx, input):
+    return input
 
-    @staticmethod
-    def typed_workflow(ctx: WorkflowContext, input: dict) -> dict:
-        return {"message": input["name"]}
 
-    @staticmethod
-    async def async_workflow(ctx: WorkflowContext, input: int) -> int:
-        return input * 2
+async def int_workflow(ctx: WorkflowContext, input: int) -> int:
+    return input * 2
 
-    @staticmethod
-    def list_workflow(
-        ctx: WorkflowContext, input: list[str]
-    ) -> tuple[int, str]:
-        return (1, "test")
 
-    @staticmethod
-    def complex_workflow(
-        ctx: WorkflowContext, input: dict[str, list[int]]
-    ) -> dict[str, Any]:
-        return {"result": [1, 2, 3]}
+def list_workflow(ctx: WorkflowContext, input: list[str]) -> tuple[int, str]:
+    return (1, "test")
+
+
+def complex_workflow(
+    ctx: WorkflowContext, input: dict[str, list[int]]
+) -> dict[str, Any]:
+    return {"result": [1, 2, 3]}
+
+
+def deep_workflow(
+    ctx: WorkflowContext, input: dict[str, dict[str, list[tuple[int, str]]]]
+) -> list[dict[str, OutputModel]]:
+    return []
+
+
+def optional_workflow(
+    ctx: WorkflowContext, input: str | None
+) -> list[int] | None:
+    return [1, 2, 3] if input else None
+
+
+def class_workflow(ctx: WorkflowContext, input: InputModel) -> OutputModel:
+    return OutputModel()
+
+
+def nested_class_workflow(
+    ctx: WorkflowContext, input: InputModel
+) -> dict[str, OutputModel]:
+    return {"result": OutputModel()}
+
+
+_INPUT_MODEL = {"name": "str", "age": "int", "tags": "list[str]"}
+_OUTPUT_MODEL = {
+    "success": "bool",
+    "data": "dict[str, Any]",
+    "timestamps": "list[int]",
+}
+
+# (workflow, expected input description, expected output description)
+_IO_CASES = [
+    pytest.param(typed_workflow, "dict", "dict", id="basic"),
+    pytest.param(untyped_workflow, "Any", "Any", id="untyped"),
+    pytest.param(int_workflow, "int", "int", id="simple"),
+    pytest.param(list_workflow, "list[str]", "tuple[int, str]", id="generic"),
+    pytest.param(
+        complex_workflow,
+        "dict[str, list[int]]",
+        "dict[str, Any]",
+        id="nested_generic",
+    ),
+    pytest.param(
+        deep_workflow,
+        "dict[str, dict[str, list[tuple[int, str]]]]",
+        f"list[dict[str, {_OUTPUT_MODEL}]]",
+        id="deep_generic",
+    ),
+    pytest.param(
+        optional_workflow, "str | None", "list[int] | None", id="optional"
+    ),
+    pytest.param(class_workflow, _INPUT_MODEL, _OUTPUT_MODEL, id="class"),
+    pytest.param(
+        nested_class_workflow,
+        _INPUT_MODEL,
+        f"dict[str, {_OUTPUT_MODEL}]",
+        id="nested_class",
+    ),
+]
+
+
+# Workflow construction inspects type hints, so build shared ones once
+@pytest.fixture(scope="module")
+def sync_wf():
+    return Workflow(TestWorkflow.sync_workflow)
+
+
+@pytest.fixture(scope="module")
+def async_wf():
+    return Workflow(TestWorkflow.async_workflow)
+
+
+class TestWorkflow:
 
     @staticmethod
-    def class_workflow(ctx: WorkflowContext, input: InputModel) -> OutputModel:
-        return OutputModel()
+    def sync_workflow(ctx: WorkflowContext, input: dict) -> str:
+        return f"Hello, {input['name']}!"
 
     @staticmethod
-    def nested_class_workflow(
-        ctx: WorkflowContext, input: InputModel
-    ) -> dict[str, OutputModel]:
-        return {"result": OutputModel()}
+    async def async_workflow(ctx: WorkflowContext, input: int) -> int:
+        return input * 2
 
     class DefaultValueModel:
         name: str = "default_name"
@@ -80,8 +142,8 @@ class TestWorkflow:
     ) -> str:
         return f"Processed {input.name}"
 
-    def test_workflow_initialization(self):
-        workflow = Workflow(self.sync_workflow)
+    def test_workflow_initialization(self, sync_wf):
+        workflow = sync_wf
         assert workflow.name == "sync_workflow"
         assert workflow.func == self.sync_workflow
         assert workflow.retention_period is None
@@ -92,70 +154,31 @@ class TestWorkflow:
         )
         assert workflow_with_retention.retention_period == 7
 
-    def test_get_io_types(self):
-        # Test 1: Basic types (dict)
-        workflow = Workflow(self.typed_workflow)
-        assert workflow.input == "dict"
-        assert workflow.output == "dict"
-
-        # Test 2: Untyped workflow
-        def untyped_workflow(ctx, input):
-            return input
-
-        workflow_untyped = Workflow(untyped_workflow)
-        assert workflow_untyped.input == "Any"
-        assert workflow_untyped.output == "Any"
-
-        # Test 3: Simple type (int)
-        workflow_async = Workflow(self.async_workflow)
-        assert workflow_async.input == "int"
-        assert workflow_async.output == "int"
-
-        # Test 4: Generic types (list and tuple)
-        workflow_list = Workflow(self.list_workflow)
-        assert workflow_list.input == "list[str]"
-        assert workflow_list.output == "tuple[int, str]"
-
-        # Test 5: Nested generic types
-        workflow_complex = Workflow(self.complex_workflow)
-        assert workflow_complex.input == "dict[str, list[int]]"
-        assert workflow_complex.output == "dict[str, Any]"
-
-        # Test 6: Optional types
-        def optional_workflow(
-            ctx: WorkflowContext, input: str | None
-        ) -> list[int] | None:
-            return [1, 2, 3] if input else None
-
-        workflow_optional = Workflow(optional_workflow)
-        assert workflow_optional.input == "str | None"
-        assert workflow_optional.output == "list[int] | None"
-
-    def test_get_io_types_with_classes(self):
-        # Test 7: Class types
-        workflow = Workflow(self.class_workflow)
-        assert workflow.input == {
-            "name": "str",
-            "age": "int",
-            "tags": "list[str]",
-        }
-        assert workflow.output == {
-            "success": "bool",
-            "data": "dict[str, Any]",
-            "timestamps": "list[int]",
-        }
+    @pytest.mark.parametrize("func,expected_input,expected_output", _IO_CASES)
+    def test_get_io_types(self, func, expected_input, expected_output):
+        workflow = Workflow(func)
+        assert workflow.input == expected_input
+        assert workflow.output == expected_output
 
-        # Test 8: Nested class types
-        workflow_nested = Workflow(self.nested_class_workflow)
-        assert workflow_nested.input == {
-            "name": "str",
-            "age": "int",
-            "tags": "list[str]",
-        }
-        assert (
-            workflow_nested.output
-            == "dict[str, {'success': 'bool', 'data': 'dict[str, Any]', 'timestamps': 'list[int]'}]"
-        )
+    def test_cached_class_descriptions_are_not_shared(self):
+        first = Workflow(class_workflow)
+        first.input["name"] = "changed"
+
+        second = Workflow(class_workflow)
+        assert second.input["name"] == "str"
+
+    def test_type_hints_resolved_once_per_function(self):
+        def hinted_workflow(ctx: WorkflowContext, input: dict) -> str:
+            return "ok"
+
+        with patch(
+            "app._internal.workflow.get_type_hints", wraps=get_type_hints
+        ) as mock_hints:
+            first = Workflow(hinted_workflow)
+            second = Workflow(hinted_workflow)
+
+        mock_hints.assert_called_once_with(hinted_workflow)
+        assert (first.input, first.output) == (second.input, second.output)
 
     def test_get_io_types_with_defaults(self):
         # Test 9: Default values in class
@@ -174,46 +197,65 @@ class TestWorkflow:
 
     @pytest.mark.asyncio
     async def test_handler_route_successful_execution(
-        self, mock_request, mock_internal_client
+        self, mock_request, engine, sync_wf
     ):
-        with patch(
-            "app._internal.workflow.InternalEndureClient.mark_execution_as_running"
-        ) as mock_mark_running:
-            workflow = Workflow(self.sync_workflow)
-            handler = workflow.get_handler_route()
+        handler = sync_wf.get_handler_route()
 
-            execution_id = "test-execution-id"
-            input_data = {"name": "Farah", "age": 30}
-            mock_request.json.return_value = {
-                "execution_id": execution_id,
-                "input": input_data,
-            }
+        execution_id = "test-execution-id"
+        input_data = {"name": "Farah", "age": 30}
+        mock_request.json.data = {
+            "execution_id": execution_id,
+            "input": input_data,
+        }
 
-            result = await handler(mock_request)
+        result = await handler(mock_request)
 
-            assert result == {"output": "Hello, Farah!"}
-            mock_mark_running.assert_called_once_with(execution_id)
+        assert result == {"output": "Hello, Farah!"}
+        assert len(engine.requests) == 1
+        assert engine.last_request.url.endswith(
+            f"/executions/{execution_id}/started"
+        )
 
     @pytest.mark.asyncio
     async def test_handler_route_async_workflow(
-        self, mock_request, mock_internal_client
+        self, mock_request, engine, async_wf
     ):
-        with patch(
-            "app._internal.workflow.InternalEndureClient.mark_execution_as_running"
-        ) as mock_mark_running:
-            mock_mark_running.return_value = Response(status_code=200)
-            workflow = Workflow(self.async_workflow)
-            handler = workflow.get_handler_route()
+        handler = async_wf.get_handler_route()
+
+        mock_request.json.data = {
+            "execution_id": "test-execution-id",
+            "input": 5,
+        }
+
+        result = await handler(mock_request)
 
-            mock_request.json.return_value = {
-                "execution_id": "test-execution-id",
-                "input": 5,
-            }
+        assert result == {"output": 10}
+        assert len(engine.requests) == 1
+        assert engine.last_request.url.endswith(
+            "/executions/test-execution-id/started"
+        )
+
+    @pytest.mark.asyncio
+    async def test_handler_route_keeps_large_integers_exact(
+        self, engine, async_wf
+    ):
+        """Test that the request body is parsed without losing precision."""
+        handler = async_wf.get_handler_route()
+        body = (
+            b'{"execution_id": "test-execution-id",'
+            b' "input": 123456789012345678901234567890}'
+        )
+
+        async def receive():
+            return {"type": "http.request", "body": body}
 
-            result = await handler(mock_request)
+        request = Request({"type": "http", "headers": []}, receive)
+        result = await handler(request)
 
-            assert result == {"output": 10}
-            mock_mark_running.assert_called_once_with("test-execution-id")
+        assert result == {"output": 246913578024691357802469135780}
+
+    def test_handler_route_is_built_once(self, sync_wf):
+        assert sync_wf.get_handler_route() is sync_wf.get_handler_route()
 
     @pytest.mark.asyncio
     async def test_handler_route_execution_error(self, mock_request):
@@ -223,31 +265,24 @@ class TestWorkflow:
         workflow = Workflow(failing_workflow)
         handler = workflow.get_handler_route()
 
-        mock_request.json.return_value = {
+        mock_request.json.data = {
             "execution_id": "test-execution-id",
             "input": "test-input",
         }
 
-        with patch(
-            "app._internal.workflow.InternalEndureClient.mark_execution_as_running"
-        ) as mock_mark_running:
-            mock_mark_running.return_value = None
-            with pytest.raises(EndureException) as exc_info:
-                await handler(mock_request)
-
-            assert exc_info.value.status_code == 400
-            assert exc_info.value.output["error"] == "Value error"
-            assert (
-                "Workflow execution failed" in exc_info.value.output["details"]
-            )
+        with pytest.raises(EndureException) as exc_info:
+            await handler(mock_request)
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.output["error"] == "Value error"
+        assert "Workflow execution failed" in exc_info.value.output["details"]
 
     @pytest.mark.asyncio
-    async def test_missing_required_fields(self, mock_request):
+    async def test_missing_required_fields(self, mock_request, sync_wf):
         """Test handling of requests missing required fields."""
-        workflow = Workflow(self.sync_workflow)
-        handler = workflow.get_handler_route()
+        handler = sync_wf.get_handler_route()
 
-        mock_request.json.return_value = {}
+        mock_request.json.data = {}
 
         with pytest.raises(EndureException) as exc_info:
             await handler(mock_request)
@@ -259,34 +294,28 @@ class TestWorkflow:
         )
 
     @pytest.mark.asyncio
-    async def test_invalid_input_type(self, mock_request):
+    async def test_invalid_input_type(self, mock_request, sync_wf):
         """Test handling of invalid input type for workflow."""
-        workflow = Workflow(self.sync_workflow)
-        handler = workflow.get_handler_route()
+        handler = sync_wf.get_handler_route()
 
-        with patch(
-            "app._internal.workflow.InternalEndureClient.mark_execution_as_running"
-        ) as mock_mark_running:
-            mock_mark_running.return_value = None
-            mock_request.json.return_value = {
-                "execution_id": "test-id",
-                "input": 123,  # Invalid input type for sync_workflow (expects dict)
-            }
-
-            with pytest.raises(EndureException) as exc_info:
-                await handler(mock_request)
-
-            assert exc_info.value.status_code == 500
-            assert "'int' object is not subscriptable" == str(
-                exc_info.value.output["details"]
-            )
+        mock_request.json.data = {
+            "execution_id": "test-id",
+            "input": 123,  # Invalid input type for sync_workflow (expects dict)
+        }
+
+        with pytest.raises(EndureException) as exc_info:
+            await handler(mock_request)
+
+        assert exc_info.value.status_code == 500
+        assert "'int' object is not subscriptable" == str(
+            exc_info.value.output["details"]
+        )
 
     @pytest.mark.asyncio
-    async def test_malformed_json(self, mock_request):
+    async def test_malformed_json(self, mock_request, sync_wf):
         """Test handling of malformed JSON in request."""
-        workflow = Workflow(self.sync_workflow)
-        handler = workflow.get_handler_route()
-        mock_request.json.side_effect = ValueError("Invalid JSON format")
+        handler = sync_wf.get_handler_route()
+        mock_request.json.error = ValueError("Invalid JSON format")
         with pytest.raises(EndureException) as exc_info:
             await handler(mock_request)
         assert exc_info.value.status_code == 400
@@ -302,20 +331,16 @@ class TestWorkflow:
         workflow = Workflow(failing_workflow)
         handler = workflow.get_handler_route()
 
-        with patch(
-            "app._internal.workflow.InternalEndureClient.mark_execution_as_running"
-        ) as mock_mark_running:
-            mock_mark_running.return_value = None
-            mock_request.json.return_value = {
-                "execution_id": "test-id",
-                "input": {},
-            }
+        mock_request.json.data = {
+            "execution_id": "test-id",
+            "input": {},
+        }
 
-            with pytest.raises(EndureException) as exc_info:
-                await handler(mock_request)
+        with pytest.raises(EndureException) as exc_info:
+            await handler(mock_request)
 
-            assert exc_info.value.status_code == 403
-            assert exc_info.value.output["error"] == "Custom error message"
+        assert exc_info.value.status_code == 403
+        assert exc_info.value.output["error"] == "Custom error message"
 
     @pytest.mark.asyncio
     async def test_workflow_validation_exception(self, mock_request):
@@ -332,17 +357,13 @@ class TestWorkflow:
         workflow = Workflow(failing_workflow)
         handler = workflow.get_handler_route()
 
-        with patch(
-            "app._internal.workflow.InternalEndureClient.mark_execution_as_running"
-        ) as mock_mark_running:
-            mock_mark_running.return_value = None
-            mock_request.json.return_value = {
-                "execution_id": "test-id",
-                "input": {},
-            }
-
-            with pytest.raises(EndureException) as exc_info:
-                await handler(mock_request)
-
-            assert exc_info.value.status_code == 422
-            assert "validation error" in exc_info.value.output["error"].lower()
+        mock_request.json.data = {
+            "execution_id": "test-id",
+            "input": {},
+        }
+
+        with pytest.raises(EndureException) as exc_info:
+            await handler(mock_request)
+
+        assert exc_info.value.status_code == 422
+        assert "validation error" in exc_info.value.output["error"].lower()
@@ -1,36 +1,21 @@
-from unittest.mock import patch
-
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from app import DurableApp, EndureException, Service, WorkflowContext
-from app._internal import ServiceRegistry
 
 
 class TestApp:
     @pytest.fixture(autouse=True)
-    def setup(self):
-        ServiceRegistry().clear()
+    def setup(self, engine):
+        # DurableApp adds its routes to the app it wraps, so each test needs
+        # its own FastAPI app. The registry is cleared by conftest and engine
+        # calls are answered by the stub engine.
         self.app = FastAPI()
         self.client = TestClient(self.app)
 
-        self.mark_running_patcher = patch(
-            "app._internal.internal_client.InternalEndureClient.mark_execution_as_running"
-        )
-        self.send_log_patcher = patch(
-            "app._internal.internal_client.InternalEndureClient.send_log"
-        )
-
-        self.mock_mark_running = self.mark_running_patcher.start()
-        self.mock_send_log = self.send_log_patcher.start()
-        self.mock_mark_running.return_value = {"status_code": 200}
-        self.mock_send_log.return_value = {"status_code": 200}
-
         yield
 
-        self.mark_running_patcher.stop()
-        self.send_log_patcher.stop()
         self.app = None
         self.durable_app = None
         self.client = None
@@ -138,3 +123,22 @@ class TestApp:
         )
         assert len(service2_data["workflows"]) == 1
         assert service2_data["workflows"][0]["name"] == "workflow3"
+
+    def test_discover_reflects_workflows_added_later(self):
+        test_service = Service("test_service")
+
+        @test_service.workflow(retention=7)
+        def first_workflow(input: dict, ctx: WorkflowContext):
+            return {}
+
+        self.durable_app = DurableApp(self.app)
+        first = self.client.get("/discover").json()
+        assert self.client.get("/discover").json() == first
+
+        @test_service.workflow(retention=7)
+        def second_workflow(input: dict, ctx: WorkflowContext):
+            return {}
+
+        data = self.client.get("/discover").json()
+        names = {w["name"] for w in data[0]["workflows"]}
+        assert names == {"first_workflow", "second_workflow"}
@@ -1,61 +1,99 @@
 import asyncio
+import threading
 import time
-from unittest.mock import patch
 
 import pytest
 import requests
 from fastapi import HTTPException, status
 from pydantic import BaseModel, ValidationError
 
-from app.types import LogStatus, Response, RetryMechanism
+from app.types import EndureException, LogStatus, Response, RetryMechanism
+from app.workflow_context import _BACKOFF_MAX_SECONDS, _compute_backoff
+
+# Engine replies shared by the tests below; they are only ever read
+_CREATED = Response(status_code=status.HTTP_201_CREATED, payload={}).to_dict()
+_OK = Response(status_code=status.HTTP_200_OK, payload={}).to_dict()
+_BAD_REQUEST = Response(
+    status_code=status.HTTP_400_BAD_REQUEST, payload={}
+).to_dict()
+
+
+# A retry_at that has always passed, so the retry is due immediately;
+# non-zero because a zero retry_at reads as "no retry_at given"
+_PAST = 1.0
+
+
+def _retry_at(retry_time: float) -> dict:
+    """An OK reply asking for the action to be retried at retry_time"""
+    return {**_OK, "payload": {"retry_at": retry_time}}
+
+
+def _log_args(mock_send_log) -> list:
+    """The positional arguments of every send_log call, in order"""
+    return [c.args for c in mock_send_log.call_args_list]
 
 
 @pytest.mark.asyncio
-async def test_successful_action_execution(workflow_context, sample_action):
+async def test_successful_action_execution(
+    workflow_context, sample_action, mock_send_log
+):
     """Test successful execution of an action with proper logging"""
     input_data = {"input": "data"}
     retry_mechanism = RetryMechanism.EXPONENTIAL
     max_retries = 3
 
-    mock_started_response = Response(status_code=201, payload={})
-    mock_completed_response = Response(status_code=200, payload={})
-
-    with patch(
-        "app._internal.internal_client.InternalEndureClient.send_log"
-    ) as mock_send_log:
-        mock_send_log.side_effect = [
-            mock_started_response.to_dict(),
-            mock_completed_response.to_dict(),
-        ]
+    mock_send_log.side_effect = [_CREATED, _OK]
 
-        await workflow_context.execute_action(
-            action=sample_action,
-            input_data=input_data,
-            max_retries=max_retries,
-            retry_mechanism=retry_mechanism,
-        )
-
-        assert mock_send_log.call_count == 2
-
-        # Verifying the STARTED log
-        started_log_call = mock_send_log.call_args_list[0]
-        assert started_log_call[0][0] == "test-execution-id"
-        assert started_log_call[0][1].status == LogStatus.STARTED
-        assert started_log_call[0][1].input == input_data
-        assert started_log_call[0][1].retry_mechanism == retry_mechanism
-        assert started_log_call[0][1].max_retries == max_retries
-        assert started_log_call[0][2] == sample_action.__name__
+    await workflow_context.execute_action(
+        action=sample_action,
+        input_data=input_data,
+        max_retries=max_retries,
+        retry_mechanism=retry_mechanism,
+    )
 
-        # Verifying the COMPLETED log
-        completed_log_call = mock_send_log.call_args_list[1]
-        assert completed_log_call[0][0] == "test-execution-id"
-        assert completed_log_call[0][1].status == LogStatus.COMPLETED
-        assert completed_log_call[0][1].output == {"result": input_data}
-        assert completed_log_call[0][2] == sample_action.__name__
+    assert mock_send_log.call_count == 2
+
+    # Verifying the STARTED and COMPLETED logs in one comparison
+    started, completed = _log_args(mock_send_log)
+    actual = [
+        {
+            "execution_id": started[0],
+            "status": started[1].status,
+            "name": started[2],
+            "input": started[1].input,
+            "retry_mechanism": started[1].retry_mechanism,
+            "max_retries": started[1].max_retries,
+        },
+        {
+            "execution_id": completed[0],
+            "status": completed[1].status,
+            "name": completed[2],
+            "output": completed[1].output,
+        },
+    ]
+    expected = [
+        {
+            "execution_id": "test-execution-id",
+            "status": LogStatus.STARTED,
+            "name": sample_action.__name__,
+            "input": input_data,
+            "retry_mechanism": retry_mechanism,
+            "max_retries": max_retries,
+        },
+        {
+            "execution_id": "test-execution-id",
+            "status": LogStatus.COMPLETED,
+            "name": sample_action.__name__,
+            "output": {"result": input_data},
+        },
+    ]
+    assert actual == expected
 
 
 @pytest.mark.asyncio
-async def test_already_executed_action(workflow_context, sample_action):
+async def test_already_executed_action(
+    workflow_context, sample_action, mock_send_log
+):
     """Test handling of already executed actions"""
     input_data = {"input": "data"}
     idempotent_result = {"output": "result"}
@@ -63,22 +101,21 @@ async def test_already_executed_action(workflow_context, sample_action):
     mock_response = Response(
         status_code=status.HTTP_208_ALREADY_REPORTED, payload=idempotent_result
     )
-    with patch(
-        "app._internal.internal_client.InternalEndureClient.send_log"
-    ) as mock_send_log:
-        mock_send_log.return_value = mock_response.to_dict()
-        result = await workflow_context.execute_action(
-            action=sample_action,
-            input_data=input_data,
-            max_retries=3,
-            retry_mechanism=RetryMechanism.EXPONENTIAL,
-        )
-        assert result == idempotent_result["output"]
-        assert mock_send_log.call_count == 1
+    mock_send_log.return_value = mock_response.to_dict()
+    result = await workflow_context.execute_action(
+        action=sample_action,
+        input_data=input_data,
+        max_retries=3,
+        retry_mechanism=RetryMechanism.EXPONENTIAL,
+    )
+    assert result == idempotent_result["output"]
+    assert mock_send_log.call_count == 1
 
 
 @pytest.mark.asyncio
-async def test_action_with_retry_success(workflow_context):
+async def test_action_with_retry_success(
+    workflow_context, mock_send_log, no_sleep
+):
     """Test action that fails with a generic Exception
     (not ValueError/ValidationError) and succeeds after retry."""
     input_data = {"input": "data"}
@@ -95,52 +132,141 @@ async def test_action_with_retry_success(workflow_context):
             raise CustomException("First attempt fails")
         return action_result
 
-    retry_time = time.time()
-    mock_responses = [
-        Response(status_code=status.HTTP_201_CREATED, payload={}),
-        Response(
-            status_code=status.HTTP_200_OK, payload={"retry_at": retry_time}
+    mock_send_log.side_effect = [_CREATED, _retry_at(_PAST), _OK]
+    result = await workflow_context.execute_action(
+        action=failing_action,
+        input_data=input_data,
+        max_retries=3,
+        retry_mechanism=RetryMechanism.EXPONENTIAL,
+    )
+    assert result == action_result
+    assert attempt_count == 2
+    assert mock_send_log.call_count == 3
+    # retry_at has already passed, so the retry is not delayed
+    no_sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_action_with_http_exception(
+    workflow_context, sample_action, mock_send_log
+):
+    """Test that HTTPException from the engine is re-raised immediately (not retried)."""
+    mock_send_log.side_effect = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST, detail="Bad request"
+    )
+    with pytest.raises(HTTPException) as exc_info:
+        await workflow_context.execute_action(
+            action=sample_action,
+            input_data={"test": "data"},
+            max_retries=3,
+            retry_mechanism=RetryMechanism.EXPONENTIAL,
+        )
+    assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+    assert exc_info.value.detail == "Bad request"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "n_retries, final_status, raised_status, error",
+    [
+        pytest.param(
+            2,
+            status.HTTP_400_BAD_REQUEST,
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "Action failed after reaching max retries",
+            id="bad_request",
+        ),
+        pytest.param(
+            3,
+            status.HTTP_404_NOT_FOUND,
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "Action failed after reaching max retries",
+            id="not_found",
         ),
-        Response(status_code=status.HTTP_200_OK, payload={}),
+        pytest.param(
+            1,
+            status.HTTP_409_CONFLICT,
+            status.HTTP_409_CONFLICT,
+            "Execution Paused or Terminated",
+            id="conflict",
+        ),
+    ],
+)
+async def test_retries_until_engine_stops_them(
+    workflow_context,
+    mock_send_log,
+    no_sleep,
+    frozen_time,
+    monkeypatch,
+    n_retries,
+    final_status,
+    raised_status,
+    error,
+):
+    """Test that a failing action waits for each retry_at the engine sends
+    and raises EndureException once the engine refuses another retry."""
+    retry_at = frozen_time[0] + 5
+    # Stop this test's loop clock too, so the wait the code derives from
+    # both clocks is exact; sleeps are mocked, so no timer is left waiting
+    monkeypatch.setattr(asyncio.get_running_loop(), "time", lambda: 1_000.0)
+
+    class CustomException(Exception):
+        pass
+
+    def failing_action(input_data):
+        raise CustomException("Always fails")
+
+    mock_send_log.side_effect = [
+        _CREATED,
+        *[_retry_at(retry_at)] * n_retries,
+        Response(status_code=final_status).to_dict(),
     ]
-    with patch(
-        "app._internal.internal_client.InternalEndureClient.send_log"
-    ) as mock_send_log:
-        mock_send_log.side_effect = [r.to_dict() for r in mock_responses]
-        result = await workflow_context.execute_action(
+    with pytest.raises(EndureException) as exc_info:
+        await workflow_context.execute_action(
             action=failing_action,
-            input_data=input_data,
+            input_data={"test": "data"},
             max_retries=3,
             retry_mechanism=RetryMechanism.EXPONENTIAL,
         )
-        assert result == action_result
-        assert attempt_count == 2
-        assert mock_send_log.call_count == 3
+    assert exc_info.value.status_code == raised_status
+    assert exc_info.value.output["error"] == error
+    assert mock_send_log.call_count == n_retries + 2
+    assert [c.args[0] for c in no_sleep.call_args_list] == [5.0] * n_retries
 
 
 @pytest.mark.asyncio
-async def test_action_with_http_exception(workflow_context, sample_action):
-    """Test that HTTPException from the engine is re-raised immediately (not retried)."""
-    with patch(
-        "app._internal.internal_client.InternalEndureClient.send_log"
-    ) as mock_send_log:
-        mock_send_log.side_effect = HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Bad request"
-        )
-        with pytest.raises(HTTPException) as exc_info:
-            await workflow_context.execute_action(
-                action=sample_action,
-                input_data={"test": "data"},
-                max_retries=3,
-                retry_mechanism=RetryMechanism.EXPONENTIAL,
-            )
-        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
-        assert exc_info.value.detail == "Bad request"
+async def test_retry_falls_back_to_local_backoff(
+    workflow_context, mock_send_log, no_sleep
+):
+    """Test that a missing retry_at falls back to the local backoff schedule."""
+    attempt_count = 0
+
+    class CustomException(Exception):
+        pass
+
+    def failing_action(input_data):
+        nonlocal attempt_count
+        attempt_count += 1
+        if attempt_count < 3:
+            raise CustomException("Action fails")
+        return {"result": "ok"}
+
+    mock_send_log.side_effect = [_CREATED, _OK, _OK, _OK]
+    result = await workflow_context.execute_action(
+        action=failing_action,
+        input_data={},
+        max_retries=3,
+        retry_mechanism=RetryMechanism.EXPONENTIAL,
+    )
+    assert result == {"result": "ok"}
+    assert [c.args[0] for c in no_sleep.call_args_list] == [1.0, 2.0]
 
 
 @pytest.mark.asyncio
-async def test_action_exhausts_retries(workflow_context):
-    """Test that a generic Exception (not ValueError/ValidationError) after all retries raises EndureException."""
+async def test_local_backoff_stops_after_max_retries(
+    workflow_context, mock_send_log, no_sleep
+):
+    """Test that the local backoff gives up once max_retries is spent."""
 
     class CustomException(Exception):
         pass
@@ -148,116 +274,79 @@ async def test_action_exhausts_retries(workflow_context):
     def failing_action(input_data):
         raise CustomException("Always fails")
 
-    retry_time = time.time()
-    mock_responses = [
-        Response(status_code=status.HTTP_201_CREATED, payload={}),
-        Response(
-            status_code=status.HTTP_200_OK, payload={"retry_at": retry_time}
-        ),
-        Response(
-            status_code=status.HTTP_200_OK, payload={"retry_at": retry_time}
-        ),
-        Response(status_code=status.HTTP_400_BAD_REQUEST, payload={}),
-    ]
-    with patch(
-        "app._internal.internal_client.InternalEndureClient.send_log"
-    ) as mock_send_log:
-        mock_send_log.side_effect = [r.to_dict() for r in mock_responses]
-        with pytest.raises(Exception) as exc_info:
-            await workflow_context.execute_action(
-                action=failing_action,
-                input_data={"test": "data"},
-                max_retries=3,
-                retry_mechanism=RetryMechanism.EXPONENTIAL,
-            )
-        assert (
-            exc_info.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
-        assert (
-            exc_info.value.output["error"]
-            == "Action failed after reaching max retries"
+    mock_send_log.side_effect = [_CREATED, _OK, _OK, _OK]
+    with pytest.raises(EndureException) as exc_info:
+        await workflow_context.execute_action(
+            action=failing_action,
+            input_data={},
+            max_retries=2,
+            retry_mechanism=RetryMechanism.EXPONENTIAL,
         )
+    assert exc_info.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert mock_send_log.call_count == 4
+    assert [c.args[0] for c in no_sleep.call_args_list] == [1.0, 2.0]
 
 
 @pytest.mark.asyncio
-async def test_retry_respects_timing(workflow_context):
-    """Test that retry mechanism respects the timing specified by the engine."""
-    input_data = {"test": "data"}
-    future_retry_time = time.time() + 5
+async def test_engine_error_without_retry_at_is_not_retried(
+    workflow_context, mock_send_log, no_sleep
+):
+    """Test that an engine error reply without retry_at raises instead of
+    falling back to the local backoff."""
 
     class CustomException(Exception):
         pass
 
     def failing_action(input_data):
-        raise CustomException("Action fails")
+        raise CustomException("Always fails")
 
-    mock_responses = [
-        Response(status_code=status.HTTP_201_CREATED, payload={}),
-        Response(
-            status_code=status.HTTP_200_OK,
-            payload={"retry_at": future_retry_time},
-        ),
-        Response(
-            status_code=status.HTTP_200_OK,
-            payload={"retry_at": future_retry_time},
-        ),
-        Response(
-            status_code=status.HTTP_200_OK,
-            payload={"retry_at": future_retry_time},
-        ),
-        Response(status_code=status.HTTP_400_BAD_REQUEST, payload={}),
+    mock_send_log.side_effect = [
+        _CREATED,
+        Response(status_code=status.HTTP_503_SERVICE_UNAVAILABLE).to_dict(),
     ]
-    with patch(
-        "app._internal.internal_client.InternalEndureClient.send_log"
-    ) as mock_send_log:
-        mock_send_log.side_effect = [r.to_dict() for r in mock_responses]
-        with patch("time.sleep") as mock_sleep:
-            try:
-                await workflow_context.execute_action(
-                    action=failing_action,
-                    input_data=input_data,
-                    max_retries=3,
-                    retry_mechanism=RetryMechanism.EXPONENTIAL,
-                )
-            except Exception:
-                pass
-            assert mock_sleep.call_count == 3
-            sleep_duration = mock_sleep.call_args[0][0]
-            assert sleep_duration > 0 and sleep_duration <= 5
-            assert mock_send_log.call_count == 5
+    with pytest.raises(RuntimeError):
+        await workflow_context.execute_action(
+            action=failing_action,
+            input_data={},
+            max_retries=3,
+            retry_mechanism=RetryMechanism.EXPONENTIAL,
+        )
+    assert mock_send_log.call_count == 2
+    no_sleep.assert_not_called()
+
+
+def test_local_backoff_is_capped():
+    """Test that the local backoff delay never exceeds its cap."""
+    assert (
+        _compute_backoff(30, RetryMechanism.EXPONENTIAL)
+        == _BACKOFF_MAX_SECONDS
+    )
 
 
 @pytest.mark.asyncio
-async def test_action_with_value_error(workflow_context):
+async def test_action_with_value_error(workflow_context, mock_send_log):
     """Test that ValueError from the action is re-raised immediately (not retried) and logs FAILED."""
 
     def action_raises_value_error(input_data):
         raise ValueError("Immediate failure")
 
-    mock_responses = [
-        Response(status_code=status.HTTP_201_CREATED, payload={}),
-        Response(status_code=status.HTTP_200_OK, payload={}),
-    ]
-    with patch(
-        "app._internal.internal_client.InternalEndureClient.send_log"
-    ) as mock_send_log:
-        mock_send_log.side_effect = [r.to_dict() for r in mock_responses]
-        with pytest.raises(ValueError):
-            await workflow_context.execute_action(
-                action=action_raises_value_error,
-                input_data={},
-                max_retries=3,
-                retry_mechanism=RetryMechanism.EXPONENTIAL,
-            )
-        assert mock_send_log.call_count == 2
-        call_args_list = mock_send_log.call_args_list
-        assert call_args_list[0][0][1].status == LogStatus.STARTED
-        assert call_args_list[1][0][1].status == LogStatus.FAILED
-        assert "Immediate failure" in call_args_list[1][0][1].output["error"]
+    mock_send_log.side_effect = [_CREATED, _OK]
+    with pytest.raises(ValueError):
+        await workflow_context.execute_action(
+            action=action_raises_value_error,
+            input_data={},
+            max_retries=3,
+            retry_mechanism=RetryMechanism.EXPONENTIAL,
+        )
+    assert mock_send_log.call_count == 2
+    args = _log_args(mock_send_log)
+    assert args[0][1].status == LogStatus.STARTED
+    assert args[1][1].status == LogStatus.FAILED
+    assert "Immediate failure" in args[1][1].output["error"]
 
 
 @pytest.mark.asyncio
-async def test_action_with_validation_error(workflow_context):
+async def test_action_with_validation_error(workflow_context, mock_send_log):
     """Test that ValidationError from the action is re-raised immediately (not retried) and logs FAILED."""
 
     class DummyModel(BaseModel):
@@ -266,83 +355,69 @@ async def test_action_with_validation_error(workflow_context):
     def action_raises_validation_error(input_data):
         raise ValidationError([], model=DummyModel)
 
-    mock_started_response = Response(
-        status_code=status.HTTP_201_CREATED, payload={}
-    )
-    mock_failed_response = Response(status_code=status.HTTP_200_OK, payload={})
-    with patch(
-        "app._internal.internal_client.InternalEndureClient.send_log"
-    ) as mock_send_log:
-        mock_send_log.side_effect = [
-            mock_started_response.to_dict(),
-            mock_failed_response.to_dict(),
-        ]
-        with pytest.raises(ValidationError):
-            await workflow_context.execute_action(
-                action=action_raises_validation_error,
-                input_data={},
-                max_retries=3,
-                retry_mechanism=RetryMechanism.EXPONENTIAL,
-            )
-        assert mock_send_log.call_count == 2
-        started_log = mock_send_log.call_args_list[0][0][1]
-        failed_log = mock_send_log.call_args_list[1][0][1]
-        assert hasattr(started_log, "status")
-        assert hasattr(failed_log, "status")
-        assert started_log.status == LogStatus.STARTED
-        assert failed_log.status == LogStatus.FAILED
-        assert "validation error" in failed_log.output["error"].lower()
+    mock_send_log.side_effect = [_CREATED, _OK]
+    with pytest.raises(ValidationError):
+        await workflow_context.execute_action(
+            action=action_raises_validation_error,
+            input_data={},
+            max_retries=3,
+            retry_mechanism=RetryMechanism.EXPONENTIAL,
+        )
+    assert mock_send_log.call_count == 2
+    args = _log_args(mock_send_log)
+    started_log = args[0][1]
+    failed_log = args[1][1]
+    assert hasattr(started_log, "status")
+    assert hasattr(failed_log, "status")
+    assert started_log.status == LogStatus.STARTED
+    assert failed_log.status == LogStatus.FAILED
+    assert "validation error" in failed_log.output["error"].lower()
 
 
 @pytest.mark.asyncio
-async def test_action_with_requests_exception(workflow_context):
+async def test_action_with_requests_exception(workflow_context, mock_send_log):
     """Test that requests.exceptions.RequestException
     is re-raised immediately (not retried) and only logs STARTED."""
 
     def action_raises_requests_exception(input_data):
         raise requests.exceptions.RequestException("Request failed")
 
-    mock_response = Response(status_code=status.HTTP_201_CREATED, payload={})
-    with patch(
-        "app._internal.internal_client.InternalEndureClient.send_log"
-    ) as mock_send_log:
-        mock_send_log.return_value = mock_response.to_dict()
-        with pytest.raises(requests.exceptions.RequestException):
-            await workflow_context.execute_action(
-                action=action_raises_requests_exception,
-                input_data={},
-                max_retries=3,
-                retry_mechanism=RetryMechanism.EXPONENTIAL,
-            )
-        assert mock_send_log.call_count == 1
-        call_args_list = mock_send_log.call_args_list
-        assert call_args_list[0][0][1].status == LogStatus.STARTED
+    mock_send_log.return_value = _CREATED
+    with pytest.raises(requests.exceptions.RequestException):
+        await workflow_context.execute_action(
+            action=action_raises_requests_exception,
+            input_data={},
+            max_retries=3,
+            retry_mechanism=RetryMechanism.EXPONENTIAL,
+        )
+    assert mock_send_log.call_count == 1
+    args = _log_args(mock_send_log)
+    assert args[0][1].status == LogStatus.STARTED
 
 
 @pytest.mark.asyncio
-async def test_value_error_in_first_send_log(workflow_context):
+async def test_value_error_in_first_send_log(workflow_context, mock_send_log):
     """Test that ValueError in the first send_log is raised and not logged as FAILED."""
 
     def dummy_action(input_data):
         return "should not be called"
 
-    with patch(
-        "app._internal.internal_client.InternalEndureClient.send_log"
-    ) as mock_send_log:
-        mock_send_log.side_effect = ValueError("First log error")
-        with pytest.raises(ValueError) as exc_info:
-            await workflow_context.execute_action(
-                action=dummy_action,
-                input_data={},
-                max_retries=3,
-                retry_mechanism=RetryMechanism.EXPONENTIAL,
-            )
-        assert "First log error" in str(exc_info.value)
-        assert mock_send_log.call_count == 1
+    mock_send_log.side_effect = ValueError("First log error")
+    with pytest.raises(ValueError) as exc_info:
+        await workflow_context.execute_action(
+            action=dummy_action,
+            input_data={},
+            max_retries=3,
+            retry_mechanism=RetryMechanism.EXPONENTIAL,
+        )
+    assert "First log error" in str(exc_info.value)
+    assert mock_send_log.call_count == 1
 
 
 @pytest.mark.asyncio
-async def test_execute_action_with_async_action(workflow_context):
+async def test_execute_action_with_async_action(
+    workflow_context, mock_send_log
+):
     called = False
 
     async def async_action(input_data):
@@ -351,23 +426,118 @@ async def test_execute_action_with_async_action(workflow_context):
         await asyncio.sleep(0.01)
         return {"result": input_data}
 
-    mock_started_response = Response(status_code=201, payload={})
-    mock_completed_response = Response(status_code=200, payload={})
-
-    with patch(
-        "app._internal.internal_client.InternalEndureClient.send_log"
-    ) as mock_send_log:
-        mock_send_log.side_effect = [
-            mock_started_response.to_dict(),
-            mock_completed_response.to_dict(),
-        ]
-
-        result = await workflow_context.execute_action(
-            action=async_action,
-            input_data={"foo": "bar"},
-            max_retries=1,
-            retry_mechanism=RetryMechanism.EXPONENTIAL,
+    mock_send_log.side_effect = [_CREATED, _OK]
+
+    result = await workflow_context.execute_action(
+        action=async_action,
+        input_data={"foo": "bar"},
+        max_retries=1,
+        retry_mechanism=RetryMechanism.EXPONENTIAL,
+    )
+
+    assert called is True
+    assert result == {"result": {"foo": "bar"}}
+
+
+@pytest.mark.asyncio
+async def test_sync_action_runs_off_the_event_loop(
+    workflow_context, mock_send_log
+):
+    """Test that a synchronous action runs in a worker thread."""
+    loop_thread = threading.get_ident()
+    action_thread = None
+
+    def sync_action(input_data):
+        nonlocal action_thread
+        action_thread = threading.get_ident()
+        return input_data
+
+    mock_send_log.side_effect = [_CREATED, _OK]
+    result = await workflow_context.execute_action(
+        action=sync_action,
+        input_data={"foo": "bar"},
+        max_retries=1,
+        retry_mechanism=RetryMechanism.EXPONENTIAL,
+    )
+
+    assert result == {"foo": "bar"}
+    assert action_thread is not None
+    assert action_thread != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_action_timeout_is_logged_as_failure(
+    workflow_context, mock_send_log
+):
+    """Test that an attempt exceeding the timeout fails and is logged as FAILED."""
+
+    async def slow_action(input_data):
+        await asyncio.sleep(1)
+
+    mock_send_log.side_effect = [_CREATED, _BAD_REQUEST]
+    with pytest.raises(EndureException):
+        await workflow_context.execute_action(
+            action=slow_action,
+            input_data={},
+            max_retries=0,
+            retry_mechanism=RetryMechanism.CONSTANT,
+            timeout=0.01,
         )
+    failed_log = _log_args(mock_send_log)[1][1]
+    assert failed_log.status == LogStatus.FAILED
+    assert "timed out after 0.01 seconds" in failed_log.output["error"]
+
+
+@pytest.mark.asyncio
+async def test_action_timeout_error_is_not_rewritten(workflow_context):
+    """Test that a TimeoutError raised by the action within its time limit
+    is passed through as the action's own error."""
+
+    async def action(input_data):
+        raise TimeoutError("db connect timeout")
+
+    with pytest.raises(TimeoutError, match="db connect timeout"):
+        await workflow_context._call_action(action, {}, False, 5.0, False)
 
-        assert called is True
-        assert result == {"result": {"foo": "bar"}}
+
+@pytest.mark.asyncio
+async def test_timed_out_sync_attempt_finishes_before_retry(
+    workflow_context,
+):
+    """Test that a timed-out sync attempt has finished by the time its
+    timeout is reported, so the next attempt cannot overlap it."""
+    finished = threading.Event()
+
+    def slow_action(input_data):
+        time.sleep(0.1)
+        finished.set()
+
+    with pytest.raises(TimeoutError, match="timed out after 0.01 seconds"):
+        await workflow_context._call_action(
+            slow_action, {}, False, 0.01, False
+        )
+    assert finished.is_set()
+
+
+@pytest.mark.asyncio
+async def test_timed_out_sync_attempt_may_overlap_when_allowed(
+    workflow_context,
+):
+    """Test that overlap_timed_out reports the timeout while the timed-out
+    sync attempt is still running."""
+    release = threading.Event()
+    finished = threading.Event()
+
+    def blocked_action(input_data):
+        release.wait(5)
+        finished.set()
+
+    try:
+        with pytest.raises(TimeoutError):
+            await workflow_context._call_action(
+                blocked_action, {}, False, 0.01, True
+            )
+        assert not finished.is_set()
+    finally:
+        release.set()
+    assert finished.wait(5)